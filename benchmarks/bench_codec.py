@@ -0,0 +1,103 @@
+"""Packet codec microbenchmarks.
+
+Compares the encode and decode cost per packet of the precompiled codec
+against the previous struct.pack concatenation and modbus_crc based code.
+
+    python benchmarks/bench_codec.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import struct
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from zonetouch.codec import check_crc  # noqa: E402
+from zonetouch.messages.fullstate import FullState  # noqa: E402
+from zonetouch.messages.group import GroupCommand  # noqa: E402
+from zonetouch.messages.spill import Spill  # noqa: E402
+
+try:
+    import modbus_crc
+except ImportError:
+    modbus_crc = None
+
+NUMBER = 20000
+
+
+def legacy_position_packet(msg_id: int, group_id: int, position: int) -> bytes:
+    """Build a position packet the way GroupCommand used to."""
+    data = struct.pack(">BBB", 0x80, 0xB0, msg_id)
+    data += struct.pack(">B", 0xC0)
+    data += struct.pack(">BBB", 0, 12, 0x20)
+    data += struct.pack(">BHHHBBBB", 0, 0, 4, 1, group_id, 0x80, position, 0)
+    crc = modbus_crc.crc16(data)
+    return struct.pack(">BBBB", 0x55, 0x55, 0x55, 0xAA) + data + struct.pack(
+        "<BB", crc[1], crc[0]
+    )
+
+
+def legacy_full_state_packet(msg_id: int) -> bytes:
+    """Build a full state packet the way FullState used to."""
+    data = struct.pack(">BBB", 0x90, 0xB0, msg_id)
+    data += struct.pack(">B", 0x1F)
+    data += struct.pack(">H", 2)
+    data += struct.pack(">H", 0xFFF0)
+    crc = modbus_crc.crc16(data)
+    return struct.pack(">BBBB", 0x55, 0x55, 0x55, 0xAA) + data + struct.pack(
+        "<BB", crc[1], crc[0]
+    )
+
+
+def legacy_validate(data: bytes) -> bool:
+    """Validate a frame the way ZoneTouchMessage used to."""
+    crc_orig = data[-2:]
+    crc_check = modbus_crc.crc16(data[4:-2])
+    valid = crc_orig[0] == crc_check[1] and crc_orig[1] == crc_check[0]
+    struct.unpack(">IBBBBH", data[:10])
+    return valid
+
+
+def report(name: str, func) -> float:
+    """Time a function and print the cost per call."""
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    cost = seconds / NUMBER * 1e9
+    print(f"{name:<40} {cost:>10.0f} ns/packet")
+    return cost
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    position = GroupCommand().build_position_packet(3, 50, 1)
+    full_state = FullState().build_packet(1)
+
+    print("encode")
+    report(
+        "GroupCommand.build_position_packet",
+        lambda: GroupCommand().build_position_packet(3, 50, 1),
+    )
+    report(
+        "GroupCommand.build_closed_packet",
+        lambda: GroupCommand().build_closed_packet(3, True, 1),
+    )
+    report("FullState.build_packet", lambda: FullState().build_packet(1))
+    report("Spill.build_packet", lambda: Spill().build_packet(1))
+    if modbus_crc:
+        report("legacy position packet", lambda: legacy_position_packet(1, 3, 50))
+        report("legacy full state packet", lambda: legacy_full_state_packet(1))
+
+    print("decode")
+    report("check_crc (position)", lambda: check_crc(position))
+    report("check_crc (full state)", lambda: check_crc(full_state))
+    if modbus_crc:
+        report("legacy validate (position)", lambda: legacy_validate(position))
+        report("legacy validate (full state)", lambda: legacy_validate(full_state))
+    else:
+        print("modbus_crc is not installed, skipping the legacy comparison")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Parser benchmarks over the golden frames.
+
+Reports the time, the blocks kept and the peak memory allocated per frame for
+every parser, and with --check fails when a parser is slower than its
+budget. The budgets leave room for slower machines, a parser going over one
+has regressed.
+
+    python benchmarks/bench_parsers.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import sys
+import timeit
+
+from golden import FULL_STATE_GROUP_COUNTS, allocations, golden_frames
+from simulator import build_state
+
+from zonetouch.group import ZoneTouch3Group
+from zonetouch.message import ZoneTouchMessage
+from zonetouch.messages.spill import Spill
+from zonetouch.state import ZoneTouch3State
+
+NUMBER = 2000
+
+# Upper bound of the cost of each benchmark in ns/frame, about three times
+# the cost measured when the budgets were set
+BUDGETS: dict[str, float] = {
+    **{
+        f"ZoneTouch3State.from_bytes full_state_{count}": 30000 + 5000 * count
+        for count in FULL_STATE_GROUP_COUNTS
+    },
+    "ZoneTouchMessage sensor": 25000,
+    "ZoneTouchMessage group_control": 75000,
+    "ZoneTouch3Group.parse_group_control group_control": 40000,
+    "updateFromMessage group_control": 60000,
+    "ZoneTouchMessage spill": 30000,
+    "Spill.from_bytes spill": 25000,
+}
+
+
+def state_from_bytes(frame: bytes) -> Callable[[], object]:
+    """Return a benchmark parsing a full state frame."""
+    return lambda: ZoneTouch3State.from_bytes(frame)
+
+
+def benchmarks(frames: dict[str, bytes]) -> dict[str, Callable[[], object]]:
+    """Return the benchmarks by name."""
+    state = build_state(8)
+    group_control = frames["group_control"]
+    group_control_msg = ZoneTouchMessage(group_control)
+    cases: dict[str, Callable[[], object]] = {
+        f"ZoneTouch3State.from_bytes full_state_{count}": state_from_bytes(
+            frames[f"full_state_{count}"]
+        )
+        for count in FULL_STATE_GROUP_COUNTS
+    }
+    cases.update(
+        {
+            "ZoneTouchMessage sensor": lambda: ZoneTouchMessage(
+                frames["sensor"]
+            ).temperature,
+            "ZoneTouchMessage group_control": lambda: ZoneTouchMessage(
+                group_control
+            ).groups,
+            "ZoneTouch3Group.parse_group_control group_control": lambda: (
+                ZoneTouch3Group.parse_group_control(
+                    group_control_msg.message_data,
+                    group_control_msg.count,
+                    group_control_msg.record_length,
+                )
+            ),
+            "updateFromMessage group_control": lambda: state.updateFromMessage(
+                ZoneTouchMessage(group_control)
+            ),
+            "ZoneTouchMessage spill": lambda: ZoneTouchMessage(
+                frames["spill"]
+            ).spill_groups,
+            "Spill.from_bytes spill": lambda: Spill.from_bytes(frames["spill"]),
+        }
+    )
+    return cases
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="enforce the budgets")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(
+        f"{'benchmark':<52} {'ns/frame':>9} {'budget':>7} {'kept blocks':>11}"
+        f" {'peak bytes':>10}"
+    )
+    for name, func in benchmarks(golden_frames()).items():
+        cost = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1e9
+        budget = BUDGETS[name]
+        flag = " OVER" if cost > budget else ""
+        blocks, peak = allocations(func)
+        print(
+            f"{name:<52} {cost:>9.0f} {budget:>7.0f} {blocks:>11} {peak:>10}{flag}"
+        )
+        if cost > budget:
+            over_budget.append(name)
+
+    if args.check and over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Group state update benchmarks.
+
+Measures the time, the blocks kept and the peak memory allocated per
+RESPONSE_GROUP_CONTROL frame when applying it to the state, against the
+previous approach of building a ZoneTouch3Group per record and copying its
+fields.
+
+    python benchmarks/bench_state.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from golden import allocations  # noqa: E402
+from simulator import build_state, encode_group_control  # noqa: E402
+
+from zonetouch.codec import encode_frame  # noqa: E402
+from zonetouch.enums import Address, MessageType  # noqa: E402
+from zonetouch.group import ZoneTouch3Group  # noqa: E402
+from zonetouch.message import ZoneTouchMessage  # noqa: E402
+
+NUMBER = 5000
+
+
+def group_control_frame(group_count: int) -> bytes:
+    """Build a group control frame reporting every group."""
+    state = build_state(group_count)
+    for group in state.groups.values():
+        group.position = 55
+    return encode_frame(
+        Address.ADDRESS_REMOTE.value,
+        Address.ADDRESS_MAIN_BOARD.value,
+        1,
+        MessageType.MESSAGE_TYPE_SUBCOMMAND.value,
+        encode_group_control(list(state.groups.values())),
+    )
+
+
+def legacy_update(state, msg: ZoneTouchMessage) -> None:
+    """Apply a group control message the way updateFromMessage used to."""
+    groups = ZoneTouch3Group.parse_group_control(
+        msg.message_data, msg.count, msg.record_length
+    )
+    for groupIndex in groups:
+        state.groups[groupIndex].position = groups[groupIndex].position
+        state.groups[groupIndex].status = groups[groupIndex].status
+        state.groups[groupIndex].is_spill_on = groups[groupIndex].is_spill_on
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    print(
+        f"{'groups':>6} {'path':<8} {'ns/frame':>10} {'kept blocks/frame':>17}"
+        f" {'peak bytes/frame':>18}"
+    )
+    for group_count in (1, 8, 16, 32):
+        frame = group_control_frame(group_count)
+        for name, update in (
+            ("current", lambda state, msg: state.updateFromMessage(msg)),
+            ("legacy", legacy_update),
+        ):
+            state = build_state(group_count)
+
+            def run(state=state, update=update, frame=frame):
+                update(state, ZoneTouchMessage(frame))
+
+            seconds = min(timeit.repeat(run, number=NUMBER, repeat=3))
+            blocks, peak = allocations(run)
+            print(
+                f"{group_count:>6} {name:<8} {seconds / NUMBER * 1e9:>10.0f}"
+                f" {blocks:>17} {peak:>18}"
+            )
+
+
+if __name__ == "__main__":
+    main()
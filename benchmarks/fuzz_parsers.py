@@ -0,0 +1,147 @@
+"""Fuzz the frame parsers with truncated and malformed frames.
+
+Mutates the golden frames (truncated payloads, flipped bytes, bogus record
+counts, lengths and length prefixes), fixes up the length field and CRC so
+the frames get past validation, and feeds them to every parser. A parser
+may reject a frame with ValueError, anything else is reported as a crash.
+
+    python benchmarks/fuzz_parsers.py [--iterations 20000] [--seed 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from collections.abc import Callable
+import random
+import struct
+import sys
+import traceback
+
+from golden import golden_frames
+from simulator import build_state
+
+from zonetouch.codec import (
+    CRC,
+    CRC_SIZE,
+    DATA_LENGTH,
+    FRAME_HEADER,
+    HEADER_SIZE,
+    SUBCOMMAND_DATA_OFFSET,
+    SUBCOMMAND_OFFSET,
+    crc16,
+)
+from zonetouch.group import ZoneTouch3Group
+from zonetouch.message import ZoneTouchMessage
+from zonetouch.messages.spill import Spill
+from zonetouch.state import ZoneTouch3State
+
+# Offset of the first record within a sub command payload
+SUBCOMMAND_RECORDS_OFFSET = SUBCOMMAND_DATA_OFFSET - SUBCOMMAND_OFFSET
+
+SUBCOMMAND_COUNTS = struct.Struct(">HH")
+
+Mutation = Callable[[random.Random, bytearray], None]
+
+
+def truncate(rng: random.Random, data: bytearray) -> None:
+    """Cut the payload short."""
+    del data[rng.randrange(len(data) + 1) :]
+
+
+def flip_bytes(rng: random.Random, data: bytearray) -> None:
+    """Overwrite a few random bytes."""
+    for _ in range(rng.randint(1, 4)):
+        if data:
+            data[rng.randrange(len(data))] = rng.randrange(256)
+
+
+def bogus_counts(rng: random.Random, data: bytearray) -> None:
+    """Overwrite the record length and count of a sub command."""
+    if len(data) >= SUBCOMMAND_RECORDS_OFFSET:
+        data[4:SUBCOMMAND_RECORDS_OFFSET] = rng.randbytes(4)
+
+
+def bogus_prefix(rng: random.Random, data: bytearray) -> None:
+    """Overwrite a byte near the end of the system info, a length prefix."""
+    if len(data) > 100:
+        data[rng.randrange(90, min(len(data), 160))] = rng.choice((0, 127, 128, 255))
+
+
+MUTATIONS: tuple[Mutation, ...] = (truncate, flip_bytes, bogus_counts, bogus_prefix)
+
+
+def build(header: bytes, data: bytes) -> bytes:
+    """Rebuild a frame around a payload with a matching length and CRC."""
+    body = header[len(FRAME_HEADER) : HEADER_SIZE - DATA_LENGTH.size]
+    body += DATA_LENGTH.pack(len(data)) + data
+    return FRAME_HEADER + body + CRC.pack(crc16(body))
+
+
+def mutate(rng: random.Random, frame: bytes) -> bytes:
+    """Return a mutated copy of a frame that still passes validation."""
+    data = bytearray(frame[HEADER_SIZE:-CRC_SIZE])
+    for _ in range(rng.randint(1, 3)):
+        rng.choice(MUTATIONS)(rng, data)
+    return build(frame[:HEADER_SIZE], bytes(data))
+
+
+def parse_message(frame: bytes) -> None:
+    """Decode every payload field of a message and apply it to a state."""
+    msg = ZoneTouchMessage(frame)
+    _ = msg.groups, msg.group_names
+    _ = msg.temperature, msg.spill_groups
+    build_state(8).updateFromMessage(msg)
+
+
+def parse_group_records(frame: bytes) -> None:
+    """Parse the payload as group control and group name records."""
+    if len(frame) < SUBCOMMAND_DATA_OFFSET + CRC_SIZE:
+        return
+    data = frame[SUBCOMMAND_DATA_OFFSET:-CRC_SIZE]
+    record_length, count = SUBCOMMAND_COUNTS.unpack_from(frame, SUBCOMMAND_OFFSET + 4)
+    ZoneTouch3Group.parse_group_control(data, count, record_length)
+    ZoneTouch3Group.parse_group_names(data, count, record_length)
+
+
+# Every parser is run on its own, so one rejecting a frame does not hide
+# crashes of the others
+PARSERS: dict[str, Callable[[bytes], object]] = {
+    "ZoneTouchMessage": parse_message,
+    "ZoneTouch3State.from_bytes": ZoneTouch3State.from_bytes,
+    "Spill.from_bytes": Spill.from_bytes,
+    "ZoneTouch3Group": parse_group_records,
+}
+
+
+def main() -> None:
+    """Run the fuzzer."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    frames = list(golden_frames().values())
+    rejected: Counter[str] = Counter()
+    crashes: dict[str, tuple[bytes, str]] = {}
+    for _ in range(args.iterations):
+        frame = mutate(rng, rng.choice(frames))
+        for name, parse in PARSERS.items():
+            try:
+                parse(frame)
+            except ValueError:
+                rejected[name] += 1
+            except Exception as err:  # noqa: BLE001
+                where = traceback.extract_tb(err.__traceback__)[-1]
+                key = f"{type(err).__name__} at {where.name}:{where.lineno}"
+                crashes.setdefault(key, (frame, traceback.format_exc()))
+
+    print(f"{args.iterations} frames, rejected: {dict(rejected)}")
+    for key, (frame, trace) in crashes.items():
+        print(f"\nCRASH {key}\n{frame.hex()}\n{trace}")
+    sys.exit(1 if crashes else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Golden frames and allocation counting shared by the benchmarks and fuzzer.
+
+The frames are built with the simulator encoders from fixed states, so they
+are identical on every run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from simulator import (  # noqa: E402
+    build_state,
+    encode_full_state,
+    encode_group_control,
+    encode_sensor,
+    encode_spill,
+)
+
+from zonetouch.codec import encode_frame  # noqa: E402
+from zonetouch.enums import Address, MessageType  # noqa: E402
+
+FULL_STATE_GROUP_COUNTS = (1, 8, 16, 32)
+
+# Allocations of tracemalloc itself, such as the snapshots
+_TRACEMALLOC_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+
+def _subcommand_frame(data: bytes) -> bytes:
+    """Wrap sub command data in a frame from the main board."""
+    return encode_frame(
+        Address.ADDRESS_REMOTE.value,
+        Address.ADDRESS_MAIN_BOARD.value,
+        1,
+        MessageType.MESSAGE_TYPE_SUBCOMMAND.value,
+        data,
+    )
+
+
+def golden_frames() -> dict[str, bytes]:
+    """Return the golden frames by name."""
+    frames: dict[str, bytes] = {}
+    for group_count in FULL_STATE_GROUP_COUNTS:
+        state = build_state(group_count)
+        frames[f"full_state_{group_count}"] = encode_frame(
+            Address.ADDRESS_REMOTE.value,
+            Address.ADDRESS_CONSOLE.value,
+            1,
+            MessageType.MESSAGE_TYPE_EXPAND.value,
+            encode_full_state(state),
+        )
+    state = build_state(8)
+    for group in state.groups.values():
+        group.position = 55
+        group.is_spill_set = group.id % 3 == 0
+    frames["sensor"] = _subcommand_frame(encode_sensor(21.5))
+    frames["group_control"] = _subcommand_frame(
+        encode_group_control(list(state.groups.values()))
+    )
+    frames["spill"] = _subcommand_frame(encode_spill(state))
+    return frames
+
+
+def allocations(func: Callable[[], object]) -> tuple[int, int]:
+    """Return the blocks and peak bytes allocated by running func once.
+
+    tracemalloc only sees memory that is still allocated, so the blocks are
+    counted from a snapshot diff taken while the result of func is alive:
+    the objects func returns or keeps. Temporaries freed before func returns
+    only show in the peak bytes.
+    """
+    func()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks, peak - start
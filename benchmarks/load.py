@@ -0,0 +1,108 @@
+"""Drive a ZoneTouch client against the simulator under load and disconnects.
+
+Starts the simulator with fragmentation, frame coalescing and random
+disconnects, lets the client supervisor reconnect and resync, and queues
+rounds of group controls for every group. Fails when the client state does
+not match the simulator once the commands have settled.
+
+    python benchmarks/load.py [--groups 8] [--rounds 50] [--disconnect 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+from simulator import ZoneTouch3Impairments, ZoneTouch3Simulator, build_state
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from zonetouch.enums import GroupControl  # noqa: E402
+from zonetouch.supervisor import ZoneTouchSupervisor  # noqa: E402
+from zonetouch.zonetouch import ZoneTouch, ZoneTouch3Exception  # noqa: E402
+
+ROUND_INTERVAL = 0.1
+SETTLE_ATTEMPTS = 20
+
+
+async def run(args: argparse.Namespace) -> bool:
+    """Run the load and return true if the client state matches."""
+    simulator = ZoneTouch3Simulator(
+        build_state(args.groups),
+        port=0,
+        sensor_interval=0.01,
+        impairments=ZoneTouch3Impairments(
+            fragment_size=7,
+            coalesce=2,
+            disconnect_probability=args.disconnect,
+        ),
+    )
+    await simulator.start()
+    disconnects = 0
+
+    def on_disconnect() -> None:
+        nonlocal disconnects
+        disconnects += 1
+
+    client = ZoneTouch("127.0.0.1", simulator.port, None, on_disconnect)
+    client.supervisor = ZoneTouchSupervisor(client, 0.05, 0.2)
+    client.start()
+    try:
+        futures = []
+        for position in range(args.rounds):
+            futures.extend(
+                client.queue_group_command(
+                    group_id, GroupControl.SET_POSITION, (position + group_id) % 101
+                )
+                for group_id in range(args.groups)
+            )
+            await asyncio.sleep(ROUND_INTERVAL)
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        failed = sum(isinstance(result, BaseException) for result in results)
+
+        # Commands lost to a disconnect are not resent, the resync after the
+        # reconnect brings the client up to date with the simulator
+        expected = {
+            group_id: group.position
+            for group_id, group in simulator.state.groups.items()
+        }
+        for _ in range(SETTLE_ATTEMPTS):
+            try:
+                await client.async_get_full_state()
+                break
+            except (TimeoutError, ZoneTouch3Exception):
+                await asyncio.sleep(0.2)
+        actual = {
+            group_id: group.position for group_id, group in client.state.groups.items()
+        }
+    finally:
+        await client.stop()
+        await simulator.stop()
+
+    print(
+        f"{len(futures)} group controls, {failed} failed,"
+        f" {disconnects} disconnects, {simulator.frames_received} frames received"
+        f" by the simulator"
+    )
+    print(json.dumps(client.metrics.snapshot(), default=str, indent=2))
+    if actual != expected:
+        print(f"State mismatch:\n  client    {actual}\n  simulator {expected}")
+        return False
+    return True
+
+
+def main() -> None:
+    """Run the load."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--disconnect", type=float, default=0.02)
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Replay a frame capture through the parser.
+
+Feeds every received frame of a capture written by ZoneTouchCapture through
+ZoneTouchMessage, ZoneTouch3State.updateFromMessage and, for spill frames,
+Spill.from_bytes, as fast as possible and reports the frames per second.
+The rotated backups of the capture are read first, oldest first, so the full
+state frame of the sync at the start of the capture is found.
+
+    python benchmarks/replay.py zonetouch.cap [--repeat 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from zonetouch.capture import read_capture  # noqa: E402
+from zonetouch.enums import CaptureDirection, MessageType, Response  # noqa: E402
+from zonetouch.message import ZoneTouchMessage  # noqa: E402
+from zonetouch.messages.spill import Spill  # noqa: E402
+from zonetouch.state import ZoneTouch3State  # noqa: E402
+
+
+def capture_files(path: Path) -> list[Path]:
+    """Return the capture and its rotated backups, oldest first."""
+    backups = {
+        int(suffix): backup
+        for backup in path.parent.glob(f"{path.name}.*")
+        if (suffix := backup.name.removeprefix(f"{path.name}.")).isdigit()
+    }
+    files = [backups[n] for n in sorted(backups, reverse=True)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def initial_state(frames: list[bytes]) -> ZoneTouch3State | None:
+    """Return the state of the first full state frame of the capture."""
+    for frame in frames:
+        msg = ZoneTouchMessage(frame)
+        if msg.valid and msg.message_type == MessageType.MESSAGE_TYPE_EXPAND:
+            return ZoneTouch3State.from_bytes(frame)
+    return None
+
+
+def replay(frames: list[bytes], state: ZoneTouch3State) -> int:
+    """Feed the frames through the parser and return the number of changes."""
+    changed = 0
+    for frame in frames:
+        msg = ZoneTouchMessage(frame)
+        if not msg.valid:
+            continue
+        if msg.sub_message_type == Response.RESPONSE_SPILL:
+            Spill.from_bytes(frame)
+        if state.updateFromMessage(msg):
+            changed += 1
+    return changed
+
+
+def main() -> None:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    files = capture_files(args.capture)
+    if not files:
+        sys.exit(f"{args.capture} not found")
+    captured = [record for path in files for record in read_capture(path)]
+    frames = [
+        frame
+        for _, direction, frame in captured
+        if direction == CaptureDirection.RECEIVED
+    ]
+    if not frames:
+        sys.exit(f"{args.capture} holds no received frames")
+    if (state := initial_state(frames)) is None:
+        # Without the groups every group frame would be a no-op
+        sys.exit(f"{args.capture} and its backups hold no full state frame")
+    print(
+        f"{len(files)} files, {len(captured)} frames captured,"
+        f" {len(frames)} received, {len(state.groups)} groups"
+    )
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        changed = replay(frames, state)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{len(frames) / best:,.0f} frames/s"
+        f" ({best / len(frames) * 1e9:.0f} ns/frame, {changed} changed the state)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+"""ZoneTouch 3 controller simulator.
+
+An asyncio TCP server that answers like a ZoneTouch 3 controller. It is meant
+for testing and load generation without hardware, and can inject latency,
+fragmentation, frame coalescing and disconnects. The encoders also build the
+golden frames of the benchmarks.
+
+    python benchmarks/simulator.py --port 7030 --groups 8 --sensor-interval 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components/hacs_zonetouch3"))
+
+from zonetouch.codec import (  # noqa: E402
+    HEADER,
+    SUBCOMMAND,
+    SUBCOMMAND_DATA_OFFSET,
+    UINT16,
+    encode_frame,
+    encode_subcommand,
+)
+from zonetouch.enums import (  # noqa: E402
+    Address,
+    Command,
+    ExData,
+    GroupControl,
+    GroupPowerStatus,
+    MessageType,
+    Response,
+    ServiceDueStatus,
+)
+from zonetouch.framer import ZoneTouchFramer  # noqa: E402
+from zonetouch.group import (  # noqa: E402
+    GROUP_RECORD,
+    GROUP_SIGN_SPILL,
+    GROUP_SIGN_TURBO,
+    ZoneTouch3Group,
+)
+from zonetouch.message import SENSOR_RECORD  # noqa: E402
+from zonetouch.messages.group import GROUP_CONTROL_RECORD  # noqa: E402
+from zonetouch.state import (  # noqa: E402
+    GROUP_INFO,
+    GROUP_INFO_NAME_OFFSET,
+    SYSTEM_INFO,
+    ZoneTouch3State,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_NAME_LENGTH = 16
+SENSOR_ADDRESS = 159
+SPILL_RECORD_LENGTH = 4
+COALESCE_TIMEOUT = 0.05
+
+
+@dataclass
+class ZoneTouch3Impairments:
+    """Network impairments applied to the simulator responses."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    fragment_size: int = 0
+    coalesce: int = 1
+    disconnect_probability: float = 0.0
+
+
+def build_state(group_count: int) -> ZoneTouch3State:
+    """Build a controller state with a number of groups."""
+    state = ZoneTouch3State()
+    state.device_id = "SIM00001"
+    state.owner = "Simulator"
+    state.service_due = ServiceDueStatus.NO
+    state.password = b"0000"
+    state.installer = b"Installer"
+    state.telephone = b"0000000000"
+    state.temperature = 21.5
+    state.hardware_version = "1.0"
+    state.firmware_version = "1.0.0"
+    state.boot_version = b"1.0"
+    state.console_version = b"1.0"
+    state.console_id = b"SIM"
+    for group_id in range(group_count):
+        state.groups[group_id] = ZoneTouch3Group(
+            group_id,
+            f"Zone {group_id + 1}",
+            100,
+            GroupPowerStatus.ON,
+            False,
+            False,
+            False,
+        )
+    return state
+
+
+def _encode(value: str | bytes) -> bytes:
+    """Encode a state string field."""
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def _group_record(group: ZoneTouch3Group) -> bytes:
+    """Encode the group control record of a group."""
+    sign = (GROUP_SIGN_TURBO if group.is_support_turbo else 0) | (
+        GROUP_SIGN_SPILL if group.is_spill_on else 0
+    )
+    return GROUP_RECORD.pack((group.status.value << 6) | group.id, group.position, sign)
+
+
+def encode_full_state(state: ZoneTouch3State) -> bytes:
+    """Encode the data of a full state response."""
+    data = SYSTEM_INFO.pack(
+        ExData.EX_DATA_FULL_STATE.value,
+        _encode(state.device_id),
+        _encode(state.owner),
+        state.opt,
+        state.service_due.value,
+        _encode(state.password),
+        _encode(state.installer),
+        _encode(state.telephone),
+        round(state.temperature * 10) + 500,
+    )
+    for version in (
+        state.hardware_version,
+        state.firmware_version,
+        state.boot_version,
+        state.console_version,
+        state.console_id,
+    ):
+        version = _encode(version)
+        data += bytes((len(version),)) + version
+
+    record_length = GROUP_INFO_NAME_OFFSET + GROUP_NAME_LENGTH
+    data += GROUP_INFO.pack(len(state.groups), record_length, GROUP_NAME_LENGTH)
+    for group in state.groups.values():
+        record = _group_record(group)
+        record += bytes(GROUP_INFO_NAME_OFFSET - len(record))
+        record += _encode(group.name)[:GROUP_NAME_LENGTH].ljust(
+            GROUP_NAME_LENGTH, b"\x00"
+        )
+        data += record
+    return data
+
+
+def encode_group_control(groups: list[ZoneTouch3Group]) -> bytes:
+    """Encode the data of a group control response."""
+    return encode_subcommand(
+        Response.RESPONSE_GROUP_CONTROL.value,
+        GROUP_RECORD.size,
+        len(groups),
+        b"".join(_group_record(group) for group in groups),
+    )
+
+
+def encode_spill(state: ZoneTouch3State) -> bytes:
+    """Encode the data of a spill response."""
+    mask = 0
+    for group in state.groups.values():
+        if group.is_spill_set:
+            mask |= 1 << group.id
+    return encode_subcommand(
+        Response.RESPONSE_SPILL.value,
+        SPILL_RECORD_LENGTH,
+        1,
+        bytes((0, 0, mask & 0xFF, 0)),
+    )
+
+
+def encode_sensor(temperature: float) -> bytes:
+    """Encode the data of a temperature sensor response."""
+    return encode_subcommand(
+        Response.RESPONSE_SENSOR.value,
+        SENSOR_RECORD.size,
+        1,
+        SENSOR_RECORD.pack(SENSOR_ADDRESS, 0, round(temperature * 10) + 500),
+    )
+
+
+class ZoneTouch3Simulator:
+    """Simulated ZoneTouch 3 controller."""
+
+    def __init__(
+        self,
+        state: ZoneTouch3State | None = None,
+        host: str = "127.0.0.1",
+        port: int = 7030,
+        sensor_interval: float = 0.0,
+        impairments: ZoneTouch3Impairments | None = None,
+    ) -> None:
+        """Init the simulator."""
+        self.state = state or build_state(8)
+        self.host = host
+        self.port = port
+        self.sensor_interval = sensor_interval
+        self.impairments = impairments or ZoneTouch3Impairments()
+        self.frames_received = 0
+        self.frames_sent = 0
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._message_id = 0
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        _LOGGER.debug("Simulator listening on %s:%s", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the simulator and close all connections."""
+        for writer in self._writers:
+            writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a single client connection."""
+        self._writers.add(writer)
+        connection = _Connection(self, writer)
+        sensor_task = None
+        if self.sensor_interval > 0:
+            sensor_task = asyncio.create_task(connection.push_sensor())
+        framer = ZoneTouchFramer()
+        try:
+            while data := await reader.read(1024):
+                framer.feed(data)
+                for frame in framer:
+                    self.frames_received += 1
+                    for response in self.handle_frame(frame):
+                        await connection.send(response)
+        except (ConnectionError, _Disconnect):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled on shutdown, which the stream protocol of Python 3.11
+            # would report as an unhandled error
+            pass
+        finally:
+            if sensor_task:
+                sensor_task.cancel()
+            connection.close()
+            self._writers.discard(writer)
+            writer.close()
+
+    def next_message_id(self) -> int:
+        """Return the id of the next unsolicited message."""
+        self._message_id = self._message_id % 255 + 1
+        return self._message_id
+
+    def handle_frame(self, frame: bytes) -> list[bytes]:
+        """Return the responses to a received frame."""
+        _, _, addr_src, msg_id, message_type, _ = HEADER.unpack_from(frame)
+        if message_type == Command.COMMAND_EXPAND.value:
+            (data_type,) = UINT16.unpack_from(frame, HEADER.size)
+            if data_type == ExData.EX_DATA_FULL_STATE.value:
+                return [
+                    encode_frame(
+                        addr_src,
+                        Address.ADDRESS_CONSOLE.value,
+                        msg_id,
+                        MessageType.MESSAGE_TYPE_EXPAND.value,
+                        encode_full_state(self.state),
+                    )
+                ]
+            return []
+
+        if message_type != MessageType.MESSAGE_TYPE_SUBCOMMAND.value:
+            return []
+
+        sub_message_type, _, _, length, count = SUBCOMMAND.unpack_from(
+            frame, HEADER.size
+        )
+        command = (message_type << 8) | sub_message_type
+        if command == Command.COMMAND_SPILL.value:
+            data = encode_spill(self.state)
+        elif command == Command.COMMAND_GROUP_STATUS.value:
+            data = encode_group_control(list(self.state.groups.values()))
+        elif command == Command.COMMAND_GROUP_CONTROL.value:
+            groups = self.apply_group_control(frame, length, count)
+            data = encode_group_control(groups)
+        else:
+            return []
+
+        return [
+            encode_frame(
+                addr_src, Address.ADDRESS_MAIN_BOARD.value, msg_id, message_type, data
+            )
+        ]
+
+    def apply_group_control(
+        self, frame: bytes, length: int, count: int
+    ) -> list[ZoneTouch3Group]:
+        """Apply the records of a group control command."""
+        groups = []
+        for idx in range(count):
+            group_id, control, position = GROUP_CONTROL_RECORD.unpack_from(
+                frame, SUBCOMMAND_DATA_OFFSET + length * idx
+            )
+            group = self.state.groups.get(group_id)
+            if group is None:
+                continue
+            if control == GroupControl.CLOSE.value:
+                group.status = GroupPowerStatus.OFF
+            elif control == GroupControl.OPEN.value:
+                group.status = GroupPowerStatus.ON
+            elif control == GroupControl.SET_POSITION.value:
+                # Only the position changes, the zone stays on or off
+                group.position = position
+            groups.append(group)
+        return groups
+
+    def sensor_frame(self) -> bytes:
+        """Build an unsolicited temperature sensor frame."""
+        self.state.temperature = round(
+            self.state.temperature + random.choice((-0.1, 0, 0.1)), 1
+        )
+        return encode_frame(
+            Address.ADDRESS_REMOTE.value,
+            Address.ADDRESS_MAIN_BOARD.value,
+            self.next_message_id(),
+            MessageType.MESSAGE_TYPE_SUBCOMMAND.value,
+            encode_sensor(self.state.temperature),
+        )
+
+
+class _Disconnect(Exception):
+    """Raised to drop a client connection."""
+
+
+class _Connection:
+    """Writes responses to a client with the configured impairments."""
+
+    def __init__(
+        self, simulator: ZoneTouch3Simulator, writer: asyncio.StreamWriter
+    ) -> None:
+        self._simulator = simulator
+        self._impairments = simulator.impairments
+        self._writer = writer
+        self._pending: list[bytes] = []
+        self._lock = asyncio.Lock()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def push_sensor(self) -> None:
+        """Send sensor frames at the configured interval."""
+        try:
+            while True:
+                await asyncio.sleep(self._simulator.sensor_interval)
+                await self.send(self._simulator.sensor_frame())
+        except (ConnectionError, _Disconnect):
+            self._writer.close()
+
+    async def send(self, frame: bytes) -> None:
+        """Send a frame, possibly delayed, coalesced or fragmented."""
+        impairments = self._impairments
+        if impairments.latency or impairments.jitter:
+            await asyncio.sleep(
+                impairments.latency + random.uniform(0, impairments.jitter)
+            )
+
+        if random.random() < impairments.disconnect_probability:
+            _LOGGER.debug("Simulating disconnect")
+            raise _Disconnect
+
+        self._pending.append(frame)
+        if len(self._pending) < impairments.coalesce:
+            # Flush whatever is pending if no more frames follow
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    COALESCE_TIMEOUT, self._schedule_flush
+                )
+            return
+        await self.flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush pending frames from the coalesce timer."""
+        self._flush_handle = None
+        task = asyncio.create_task(self._flush_pending())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_pending(self) -> None:
+        """Flush pending frames, ignoring a closed connection."""
+        try:
+            await self.flush()
+        except ConnectionError:
+            self._writer.close()
+
+    def close(self) -> None:
+        """Stop sending pending frames."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for task in self._tasks:
+            task.cancel()
+
+    async def flush(self) -> None:
+        """Write all pending frames."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._lock:
+            if not self._pending:
+                return
+            count = len(self._pending)
+            data = b"".join(self._pending)
+            self._pending.clear()
+
+            size = self._impairments.fragment_size or len(data)
+            for start in range(0, len(data), size):
+                self._writer.write(data[start : start + size])
+                await self._writer.drain()
+            self._simulator.frames_sent += count
+
+
+def main() -> None:
+    """Run the simulator from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7030)
+    parser.add_argument("--groups", type=int, default=8)
+    parser.add_argument("--sensor-interval", type=float, default=1.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--fragment-size", type=int, default=0)
+    parser.add_argument("--coalesce", type=int, default=1)
+    parser.add_argument("--disconnect-probability", type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG)
+    simulator = ZoneTouch3Simulator(
+        build_state(args.groups),
+        args.host,
+        args.port,
+        args.sensor_interval,
+        ZoneTouch3Impairments(
+            args.latency,
+            args.jitter,
+            args.fragment_size,
+            args.coalesce,
+            args.disconnect_probability,
+        ),
+    )
+    try:
+        asyncio.run(simulator.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
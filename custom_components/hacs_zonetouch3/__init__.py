@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
+from typing import Any
 
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_loaded_integration
 
 from .const import DOMAIN
 from .coordinator import ZoneTouch3DataUpdateCoordinator
-from .data import ZoneTouch3ConfigEntry, ZoneTouch3Data
-from .zonetouch.zonetouch import ZoneTouch, ZoneTouch3ConnectionFailedException
+from .data import ZoneTouch3ConfigEntry, ZoneTouch3Data, async_get_manager
+from .services import async_setup_services
+from .store import ZoneTouch3StateStore
+from .zonetouch.zonetouch import ZoneTouch3ConnectionFailedException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +28,14 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Zone Touch 3 services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,32 +47,67 @@ async def async_setup_entry(
 
     config_entry.runtime_data = ZoneTouch3Data(
         # client=Client(hostname=entry.data[CONF_HOST]),
-        ZoneTouch(
+        async_get_manager(hass).add(
+            config_entry.entry_id,
             host=config_entry.data[CONF_HOST],
             port=config_entry.data[CONF_PORT],
-            on_state_update=coordinator.async_set_updated_data,
+            on_state_update=coordinator.async_set_state_changes,
             on_disconnect=coordinator.async_client_disconnected,
         ),
         integration=async_get_loaded_integration(hass, config_entry.domain),
         coordinator=coordinator,
     )
 
-    try:
-        await config_entry.runtime_data.client.connect()
-    except ZoneTouch3ConnectionFailedException as err:
-        raise ConfigEntryError(
-            f"Connection to ZoneTouch3 failed: {err.reason}"
-        ) from err
-
-    await coordinator.async_config_entry_first_refresh()
+    # With a stored state the entities are set up straight away and the
+    # supervisor connects and resyncs in the background
+    restored = await coordinator.async_restore_state()
+    if not restored:
+        try:
+            await config_entry.runtime_data.client.connect()
+        except ZoneTouch3ConnectionFailedException as err:
+            await async_get_manager(hass).remove(config_entry.entry_id)
+            raise ConfigEntryError(
+                f"Connection to ZoneTouch3 failed: {err.reason}"
+            ) from err
+
+    # The replies to the initial sync are read by the client listener
+    await coordinator.start_client()
+    if not restored:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await coordinator.stop_client()
+            await async_get_manager(hass).remove(config_entry.entry_id)
+            raise
+
+    await er.async_migrate_entries(
+        hass,
+        config_entry.entry_id,
+        partial(_async_migrate_unique_id, config_entry.entry_id),
+    )
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-    await coordinator.start_listener()
-    await coordinator.start_send_queue()
     config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+@callback
+def _async_migrate_unique_id(
+    entry_id: str, entity: er.RegistryEntry
+) -> dict[str, Any] | None:
+    """Prefix the unique id of an entity with its config entry id.
+
+    Fan and spill unique ids used to be the same for every controller, and
+    the diagnostic sensors had the config entry id after the domain.
+    """
+    if entity.unique_id == entry_id or entity.unique_id.startswith(f"{entry_id}_"):
+        return None
+    unique_id = entity.unique_id.replace(f"{DOMAIN}_{entry_id}_", f"{DOMAIN}_", 1)
+    unique_id = f"{entry_id}_{unique_id}"
+    _LOGGER.debug("Migrating unique id %s to %s", entity.unique_id, unique_id)
+    return {"new_unique_id": unique_id}
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     config_entry: ZoneTouch3ConfigEntry,
@@ -75,4 +124,17 @@ async def async_unload_entry(
     # If you have created any custom services, they need to be removed here too.
 
     # Unload platforms and return result
-    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        config_entry, PLATFORMS
+    )
+    if unload_ok:
+        await config_entry.runtime_data.coordinator.stop_client()
+        await async_get_manager(hass).remove(config_entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: ZoneTouch3ConfigEntry
+) -> None:
+    """Remove the stored state of a removed config entry."""
+    await ZoneTouch3StateStore(hass, config_entry.entry_id).async_remove()
@@ -45,12 +45,14 @@ class ZoneTouch3SpillSetSensor(BinarySensorEntity, ZoneTouch3Entity):
         groups: list[ZoneTouch3Group],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, None, frozenset({"is_spill_set"}))
         self.groups = groups
         self._attr_name = "Spill Set"
         self._attr_on_icon = ("mdi:fan-auto",)
         self._attr_off_icon = ("mdi:fan-off",)
-        self._attr_unique_id = f"{DOMAIN}_spill_set"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{DOMAIN}_spill_set"
+        )
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
@@ -73,12 +75,14 @@ class ZoneTouch3GroupSpillActiveSensor(BinarySensorEntity, ZoneTouch3Entity):
         group: ZoneTouch3Group,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, group.id, frozenset({"is_spill_on"}))
         self.group = group
         self._attr_name = f"{group.name} Spill Active"
         self._attr_on_icon = ("mdi:fan-auto",)
         self._attr_off_icon = ("mdi:fan-off",)
-        self._attr_unique_id = f"{DOMAIN}_fan_{group.id}_spill_active"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{DOMAIN}_fan_{group.id}_spill_active"
+        )
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
@@ -101,12 +105,14 @@ class ZoneTouch3GroupSpillSetSensor(BinarySensorEntity, ZoneTouch3Entity):
         group: ZoneTouch3Group,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, group.id, frozenset({"is_spill_set"}))
         self.group = group
         self._attr_name = f"{group.name} Spill Set"
         self._attr_on_icon = ("mdi:fan-auto",)
         self._attr_off_icon = ("mdi:fan-off",)
-        self._attr_unique_id = f"{DOMAIN}_fan_{group.id}_spill_set"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{DOMAIN}_fan_{group.id}_spill_set"
+        )
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
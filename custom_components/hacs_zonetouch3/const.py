@@ -5,5 +5,13 @@ from homeassistant.helpers.start import NoEventData
 
 DOMAIN = "zonetouch3"
 EVENT_ZONETOUCH3_FAN_PERCENTAGE: EventType[NoEventData] = EventType("zonetouch3_event")
+EVENT_ZONETOUCH3_FAN_ROLLBACK: EventType[NoEventData] = EventType(
+    "zonetouch3_fan_rollback"
+)
 ATTR_POSITION = "position"
+ATTR_ON = "on"
+ATTR_ZONES = "zones"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_SPEED = "speed"
+ATTR_START_SPEED = "start_speed"
+ATTR_REASON = "reason"
@@ -2,19 +2,51 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
 import logging
 from typing import TYPE_CHECKING
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .zonetouch.state import ZoneTouch3State
+from .events import ZoneTouch3PositionEvents
+from .store import ZoneTouch3StateStore
+from .zonetouch.enums import CommandPriority, Response
+from .zonetouch.exceptions import ZoneTouch3Exception
+from .zonetouch.messages.groupstatus import GroupStatus
+from .zonetouch.messages.spill import Spill
+from .zonetouch.state import ZoneTouch3State, ZoneTouch3StateChanges
 
 if TYPE_CHECKING:
     from .data import ZoneTouch3ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+POLL_INTERVAL_MIN = 30.0
+POLL_INTERVAL_MAX = 600.0
+# Changes received within this many seconds are dispatched together
+COALESCE_WINDOW = 0.1
+
+
+@dataclass
+class ZoneTouch3Poll:
+    """A query polled in the background.
+
+    Replies are applied to the state by the client listener, as any other
+    frame of their type.
+    """
+
+    name: str
+    build_packet: Callable[[int], bytes]
+    response: Response
+    interval: float = POLL_INTERVAL_MIN
+    frames: int = 0
+    unsub: CALLBACK_TYPE | None = None
+
 
 class ZoneTouch3DataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -25,30 +57,182 @@ class ZoneTouch3DataUpdateCoordinator(DataUpdateCoordinator):
         logger: logging.Logger,
         config_entry: ZoneTouch3ConfigEntry,
         name: str,
+        coalesce_window: float = COALESCE_WINDOW,
     ) -> None:
-        """Init the coordinator."""
+        """Init the coordinator.
+
+        Changes are merged for ``coalesce_window`` seconds before the
+        entities are notified, a window of 0 notifies them on every message.
+        """
         super().__init__(
             hass=hass,
             logger=logger,
             name=name,
             config_entry=config_entry,
         )
+        self.store = ZoneTouch3StateStore(hass, config_entry.entry_id)
+        self.position_events = ZoneTouch3PositionEvents(hass)
+        self._coalesce_window = coalesce_window
+        self._pending_changes: ZoneTouch3StateChanges | None = None
+        self._unsub_dispatch: CALLBACK_TYPE | None = None
+        self._polling = False
+        self._polls = [
+            ZoneTouch3Poll("spill", Spill().build_packet, Response.RESPONSE_SPILL),
+            ZoneTouch3Poll(
+                "group status",
+                GroupStatus().build_packet,
+                Response.RESPONSE_GROUP_CONTROL,
+            ),
+        ]
+
+    async def async_restore_state(self) -> bool:
+        """Use the stored state until the controller has been synced.
+
+        The entities are created from the stored state but stay unavailable
+        until the first resync succeeds, so cached values are never shown as
+        live while the controller is unreachable.
+        """
+        state = await self.store.async_load()
+        if state is None:
+            return False
+        _LOGGER.debug("Restored %d groups from the stored state", len(state.groups))
+        # The client merges the live state into the restored groups
+        self.config_entry.runtime_data.client.state = state
+        self.data = state
+        self.last_update_success = False
+        return True
 
     async def _async_update_data(self) -> ZoneTouch3State:
         """Update data via library."""
         _LOGGER.debug("Fetching initial state")
-        return await self.config_entry.runtime_data.client.async_get_full_state()
+        try:
+            state = await self.config_entry.runtime_data.client.async_get_full_state()
+        except (TimeoutError, ZoneTouch3Exception) as err:
+            raise UpdateFailed(f"Failed to fetch the state: {err!r}") from err
+        self.store.async_schedule_save(state)
+        return state
+
+    @callback
+    def async_set_state_changes(
+        self, state: ZoneTouch3State, changes: ZoneTouch3StateChanges
+    ) -> None:
+        """Update the state and notify the entities it affects.
+
+        Changes arriving within the coalesce window, e.g. a damper moving
+        through its positions or the echoes of a batch of commands, are merged
+        so every entity writes its state once with the final values.
+        """
+        self.data = state
+        if changes.full or changes.groups:
+            self.store.async_schedule_save(state)
+        if not self._coalesce_window:
+            self._async_dispatch_changes(changes)
+            return
+        if self._pending_changes is None:
+            self._pending_changes = ZoneTouch3StateChanges()
+            self._unsub_dispatch = async_call_later(
+                self.hass,
+                self._coalesce_window,
+                HassJob(self._async_dispatch_pending, cancel_on_shutdown=True),
+            )
+        self._pending_changes.merge(changes)
+
+    @callback
+    def _async_dispatch_pending(self, _now: datetime) -> None:
+        """Notify the entities of the changes merged in the coalesce window."""
+        self._unsub_dispatch = None
+        changes, self._pending_changes = self._pending_changes, None
+        if changes:
+            self._async_dispatch_changes(changes)
+
+    @callback
+    def _async_cancel_pending(self) -> None:
+        """Drop the changes waiting for the coalesce window to end."""
+        if self._unsub_dispatch is not None:
+            self._unsub_dispatch()
+            self._unsub_dispatch = None
+        self._pending_changes = None
+
+    @callback
+    def _async_dispatch_changes(self, changes: ZoneTouch3StateChanges) -> None:
+        """Only notify the entities the changes affect.
+
+        Entities register with a ``(group_id, attributes)`` context. Listeners
+        without a context are notified of every change.
+        """
+        if not self.last_update_success:
+            if not changes.full:
+                # Frames pushed before the resync completed, the entities
+                # stay unavailable until the whole state has been synced
+                return
+            # Resynced, every entity has to become available again
+            self.last_update_success = True
+            self.async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or changes.affects(*context):
+                update_callback()
+
+    async def start_client(self) -> None:
+        """Start the client connection tasks and the background polls."""
+        self.config_entry.runtime_data.client.start()
+        if not self._polling:
+            self._polling = True
+            for poll in self._polls:
+                self._async_schedule_poll(poll)
+
+    async def stop_client(self) -> None:
+        """Stop the background polls and the client connection tasks."""
+        self._polling = False
+        self._async_cancel_pending()
+        self.position_events.async_flush()
+        for poll in self._polls:
+            if poll.unsub is not None:
+                poll.unsub()
+                poll.unsub = None
+        await self.config_entry.runtime_data.client.stop()
+
+    @callback
+    def _async_schedule_poll(self, poll: ZoneTouch3Poll) -> None:
+        """Schedule the next run of a poll."""
+        poll.unsub = async_call_later(
+            self.hass,
+            poll.interval,
+            HassJob(partial(self._async_poll, poll), cancel_on_shutdown=True),
+        )
 
-    async def start_listener(self) -> None:
-        """Start the listener."""
-        self.config_entry.runtime_data.client.start_listener()
+    async def _async_poll(self, poll: ZoneTouch3Poll, _now: datetime) -> None:
+        """Run a poll unless its replies are already arriving.
 
-    async def start_send_queue(self) -> None:
-        self.config_entry.runtime_data.client.start_send_queue()
+        Any frame of the reply type received since the last run, pushed by
+        the controller or not, means the state is fresh. The poll is then
+        skipped and its interval doubled, up to POLL_INTERVAL_MAX. Once the
+        frames stop the poll is sent again every POLL_INTERVAL_MIN seconds.
+        Polls use the background lane, so they never delay user commands.
+        """
+        poll.unsub = None
+        client = self.config_entry.runtime_data.client
+        if client.connected:
+            if client.metrics.frames[poll.response] != poll.frames:
+                poll.interval = min(POLL_INTERVAL_MAX, poll.interval * 2)
+            else:
+                poll.interval = POLL_INTERVAL_MIN
+                try:
+                    await client.request(
+                        poll.build_packet(client.next_msg_id()),
+                        priority=CommandPriority.BACKGROUND,
+                    )
+                except (TimeoutError, ZoneTouch3Exception) as err:
+                    _LOGGER.debug("Polling %s failed: %r", poll.name, err)
+            poll.frames = client.metrics.frames[poll.response]
+        if self._polling:
+            self._async_schedule_poll(poll)
 
-    async def async_client_disconnected(self) -> None:
-        """Handle client disconnection."""
-        await self.config_entry.runtime_data.client.connect()
-        await self.config_entry.runtime_data.client.async_get_full_state()
-        await self.start_listener()
-        await self.start_send_queue()
+    @callback
+    def async_client_disconnected(self) -> None:
+        """Mark entities unavailable until the client has reconnected."""
+        _LOGGER.debug("Client disconnected")
+        # Every entity is written below, so the pending changes are covered
+        self._async_cancel_pending()
+        self.last_update_success = False
+        self.async_update_listeners()
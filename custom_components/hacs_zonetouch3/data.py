@@ -5,7 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN
 from .coordinator import ZoneTouch3DataUpdateCoordinator
+from .zonetouch.manager import ZoneTouchManager
 from .zonetouch.zonetouch import ZoneTouch
 
 if TYPE_CHECKING:
@@ -23,3 +28,20 @@ class ZoneTouch3Data:
     client: ZoneTouch
     coordinator: ZoneTouch3DataUpdateCoordinator
     integration: Integration
+
+
+@callback
+def async_get_manager(hass: HomeAssistant) -> ZoneTouchManager:
+    """Return the manager of the connections to all controllers.
+
+    The manager is created with the first config entry and stops the clients
+    of all controllers when Home Assistant stops.
+    """
+    if (manager := hass.data.get(DOMAIN)) is None:
+        manager = hass.data[DOMAIN] = ZoneTouchManager()
+
+        async def async_stop(_event: Event) -> None:
+            await manager.stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop)
+    return manager
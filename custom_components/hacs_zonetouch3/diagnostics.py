@@ -0,0 +1,29 @@
+"""Diagnostics support for Zone Touch 3."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .data import ZoneTouch3ConfigEntry, async_get_manager
+
+TO_REDACT = {CONF_HOST, "owner", "installer", "telephone"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ZoneTouch3ConfigEntry
+) -> dict[str, Any]:
+    """Return the connection health, metrics and state of a controller."""
+    state = config_entry.runtime_data.coordinator.data
+    return async_redact_data(
+        {
+            "config_entry": dict(config_entry.data),
+            "health": async_get_manager(hass).health().get(config_entry.entry_id),
+            "metrics": config_entry.runtime_data.client.metrics.snapshot(),
+            "state": state.as_dict() if state is not None else None,
+        },
+        TO_REDACT,
+    )
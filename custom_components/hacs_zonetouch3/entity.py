@@ -15,9 +15,20 @@ _LOGGER = logging.getLogger(__name__)
 class ZoneTouch3Entity(CoordinatorEntity[ZoneTouch3DataUpdateCoordinator]):
     """BlueprintEntity class."""
 
-    def __init__(self, coordinator: ZoneTouch3DataUpdateCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: ZoneTouch3DataUpdateCoordinator,
+        group_id: int | None = None,
+        attributes: frozenset[str] | None = None,
+    ) -> None:
+        """Initialize.
+
+        The group id and state attributes the entity shows limit which state
+        changes wake the entity. Without attributes every change does.
+        """
+        super().__init__(
+            coordinator, None if attributes is None else (group_id, attributes)
+        )
         self._attr_unique_id = coordinator.config_entry.entry_id
         self._attr_device_info = DeviceInfo(
             identifiers={
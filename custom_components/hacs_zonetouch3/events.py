@@ -0,0 +1,97 @@
+"""Aggregated logbook events for Zone Touch 3."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import ATTR_SPEED, ATTR_START_SPEED, EVENT_ZONETOUCH3_FAN_PERCENTAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Position changes of a group within this many seconds make one event
+POSITION_EVENT_WINDOW = 5.0
+
+
+@dataclass
+class _PendingPositionEvent:
+    """Position changes of a group waiting for the window to end."""
+
+    start: int
+    end: int
+    event_data: dict[str, Any]
+    unsub: CALLBACK_TYPE | None = None
+
+
+class ZoneTouch3PositionEvents:
+    """Collapse the position changes of each group into one event per window.
+
+    An event holds the percentage before the first change and after the last
+    one. Changes reported twice, once by the optimistic state and once by the
+    echo of the controller, only move the end percentage, and a window whose
+    changes cancel out fires no event.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, window: float = POSITION_EVENT_WINDOW
+    ) -> None:
+        """Init the aggregator."""
+        self.hass = hass
+        self._window = window
+        self._pending: dict[int, _PendingPositionEvent] = {}
+
+    @callback
+    def async_record(
+        self, group_id: int, start: int, end: int, event_data: dict[str, Any]
+    ) -> None:
+        """Record a position change of a group.
+
+        event_data identifies the entity, the latest one is used for the event.
+        """
+        pending = self._pending.get(group_id)
+        if pending is not None:
+            pending.end = end
+            pending.event_data = event_data
+            return
+        if start == end:
+            return
+        pending = self._pending[group_id] = _PendingPositionEvent(
+            start, end, event_data
+        )
+        pending.unsub = async_call_later(
+            self.hass,
+            self._window,
+            HassJob(partial(self._async_fire, group_id), cancel_on_shutdown=True),
+        )
+
+    @callback
+    def _async_fire(self, group_id: int, _now: datetime | None = None) -> None:
+        """Fire the event of a group, unless its changes cancelled out."""
+        pending = self._pending.pop(group_id, None)
+        if pending is None:
+            return
+        if pending.unsub is not None:
+            pending.unsub()
+        if pending.start == pending.end:
+            _LOGGER.debug("Position of group %d changed back, no event", group_id)
+            return
+        self.hass.bus.async_fire(
+            event_type=EVENT_ZONETOUCH3_FAN_PERCENTAGE,
+            event_data={
+                **pending.event_data,
+                ATTR_START_SPEED: pending.start,
+                ATTR_SPEED: pending.end,
+            },
+        )
+
+    @callback
+    def async_flush(self) -> None:
+        """Fire the events of all groups now."""
+        for group_id in list(self._pending):
+            self._async_fire(group_id)
@@ -1,5 +1,8 @@
 """Valve entity."""
 
+import asyncio
+from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any
 
@@ -8,11 +11,12 @@ from homeassistant.const import ATTR_DEVICE_ID, ATTR_DOMAIN, ATTR_ENTITY_ID, ATT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import ATTR_SPEED, DOMAIN, EVENT_ZONETOUCH3_FAN_PERCENTAGE
+from .const import ATTR_REASON, ATTR_SPEED, DOMAIN, EVENT_ZONETOUCH3_FAN_ROLLBACK
 from .data import ZoneTouch3ConfigEntry
 from .entity import ZoneTouch3DataUpdateCoordinator, ZoneTouch3Entity
-from .zonetouch.messages.group import GroupCommand
+from .zonetouch.enums import GroupControl
 from .zonetouch.group import GroupPowerStatus, ZoneTouch3Group
+from .zonetouch.message import ZoneTouchMessage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,8 +36,25 @@ async def async_setup_entry(
     )
 
 
+@dataclass(slots=True, eq=False)
+class ZoneTouch3FanCommand:
+    """A group control shown optimistically until confirmed.
+
+    is_on is None for controls that leave the on state of the group as is.
+    """
+
+    control: GroupControl
+    percentage: int
+    is_on: bool | None
+
+
 class ZoneTouch3FanEntity(ZoneTouch3Entity, FanEntity):
-    """Integration fan class."""
+    """Integration fan class.
+
+    Commands are shown optimistically and confirmed by the group control
+    echo of the controller. Without a matching echo the state is rolled back
+    to what the controller last reported.
+    """
 
     _attr_supported_features = (
         FanEntityFeature.SET_SPEED
@@ -48,25 +69,108 @@ class ZoneTouch3FanEntity(ZoneTouch3Entity, FanEntity):
         group: ZoneTouch3Group,
     ) -> None:
         """Initialize the fan class."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, group.id, frozenset({"name", "position", "status"})
+        )
         self.group = group
         self._attr_name = group.name
-        self._attr_unique_id = f"{DOMAIN}_fan_{group.id}"
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{DOMAIN}_fan_{group.id}"
+        )
         self._attr_percentage = group.position
+        self._attr_is_on = group.status == GroupPowerStatus.ON
+        # Latest command sent for the group, only it is checked against the echo
+        self._pending: ZoneTouch3FanCommand | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        # Keep showing the optimistic state until the command is confirmed
+        if self._pending is None:
+            self._sync_group_state()
+
+        self.async_write_ha_state()
+
+    @callback
+    def _sync_group_state(self) -> None:
+        """Show the state last reported by the controller."""
+        self._attr_is_on = self.group.status == GroupPowerStatus.ON
         if self._attr_percentage != self.group.position:
+            self.fire_position_event(self._attr_percentage, self.group.position)
             self._attr_percentage = self.group.position
-            self.fire_position_event()
 
+    @callback
+    def _async_send_optimistic(
+        self, control: GroupControl, percentage: int, is_on: bool | None
+    ) -> None:
+        """Send a group control and show its result until confirmed."""
+        client = self.coordinator.config_entry.runtime_data.client
+        future = client.queue_group_command(
+            self.group.id,
+            control,
+            percentage if control == GroupControl.SET_POSITION else 0,
+        )
+        # Controls sent within the coalesce window share one future, so the
+        # command is told apart by identity rather than by its future
+        command = self._pending = ZoneTouch3FanCommand(control, percentage, is_on)
+        future.add_done_callback(partial(self._async_confirm, command))
+        if is_on is not None:
+            self._attr_is_on = is_on
+        if self._attr_percentage != percentage:
+            self.fire_position_event(self._attr_percentage, percentage)
+            self._attr_percentage = percentage
+        self.async_write_ha_state()
+
+    @callback
+    def _async_confirm(
+        self,
+        command: ZoneTouch3FanCommand,
+        future: asyncio.Future[ZoneTouchMessage],
+    ) -> None:
+        """Confirm or roll back the optimistic state of a group control."""
+        if command is not self._pending:
+            # Superseded by a newer command
+            return
+        self._pending = None
+        control, percentage, is_on = command.control, command.percentage, command.is_on
+        if future.cancelled():
+            reason = "cancelled"
+        elif (error := future.exception()) is not None:
+            reason = "timeout" if isinstance(error, TimeoutError) else str(error)
+        elif (group := future.result().groups.get(self.group.id)) is None:
+            reason = "group missing from reply"
+        elif (
+            is_on is not None and (group.status == GroupPowerStatus.ON) != is_on
+        ) or (control == GroupControl.SET_POSITION and group.position != percentage):
+            reason = "rejected"
+        else:
+            reason = None
+
+        if reason is not None:
+            _LOGGER.warning(
+                "Rolling back %s fan, %s to %d%% not confirmed: %s",
+                self.name,
+                control.name,
+                percentage,
+                reason,
+            )
+            self.hass.bus.async_fire(
+                event_type=EVENT_ZONETOUCH3_FAN_ROLLBACK,
+                event_data={
+                    ATTR_DOMAIN: DOMAIN,
+                    ATTR_DEVICE_ID: self.device_entry.id,
+                    ATTR_ENTITY_ID: self.entity_id,
+                    ATTR_NAME: self.name,
+                    ATTR_SPEED: percentage,
+                    ATTR_REASON: reason,
+                },
+            )
+        self._sync_group_state()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the fan off."""
         _LOGGER.debug("Turning OFF %s fan", self.name)
-        payload = GroupCommand().build_closed_packet(self.group.id, True)
-        await self.coordinator.config_entry.runtime_data.client.queue_command(payload)
+        self._async_send_optimistic(GroupControl.CLOSE, self.group.position, False)
 
     async def async_turn_on(
         self,
@@ -76,32 +180,36 @@ class ZoneTouch3FanEntity(ZoneTouch3Entity, FanEntity):
     ) -> None:
         """Turn the fan on."""
         _LOGGER.debug("Turning ON %s fan (%d%%)", self.name, self.group.position)
-        payload = GroupCommand().build_closed_packet(self.group.id, False)
-        await self.coordinator.config_entry.runtime_data.client.queue_command(payload)
+        self._async_send_optimistic(GroupControl.OPEN, self.group.position, True)
 
     async def async_set_percentage(self, percentage: int) -> None:
-        """Set fan speed."""
+        """Set fan speed.
+
+        Setting the position leaves the group on or off, so 0% keeps an open
+        zone on at position 0.
+        """
         _LOGGER.debug("Setting %s fan to %d", self.name, percentage)
-        payload = GroupCommand().build_position_packet(self.group.id, percentage)
-        await self.coordinator.config_entry.runtime_data.client.queue_command(payload)
-        self._attr_percentage = percentage
-        self.fire_position_event()
-        self.async_write_ha_state()
+        self._async_send_optimistic(GroupControl.SET_POSITION, percentage, None)
 
-    def fire_position_event(self):
-        """Send logbook event for valve position."""
-        self.hass.bus.async_fire(
-            event_type=EVENT_ZONETOUCH3_FAN_PERCENTAGE,
-            event_data={
+    @callback
+    def fire_position_event(self, start: int | None, end: int) -> None:
+        """Record a valve position change for the logbook.
+
+        Changes are collapsed into one event per group and window.
+        """
+        self.coordinator.position_events.async_record(
+            self.group.id,
+            end if start is None else start,
+            end,
+            {
                 ATTR_DOMAIN: DOMAIN,
                 ATTR_DEVICE_ID: self.device_entry.id,
                 ATTR_ENTITY_ID: self.entity_id,
                 ATTR_NAME: self.name,
-                ATTR_SPEED: self._attr_percentage,
             },
         )
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the fan is ON."""
-        return self.group.status == GroupPowerStatus.ON
+        return self._attr_is_on
@@ -22,7 +22,14 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.typing import NoEventData
 from homeassistant.util.event_type import EventType
 
-from .const import DOMAIN, EVENT_ZONETOUCH3_FAN_PERCENTAGE
+from .const import (
+    ATTR_REASON,
+    ATTR_SPEED,
+    ATTR_START_SPEED,
+    DOMAIN,
+    EVENT_ZONETOUCH3_FAN_PERCENTAGE,
+    EVENT_ZONETOUCH3_FAN_ROLLBACK,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,15 +50,37 @@ def async_describe_events(
 
     @callback
     def async_describe_hass_event(event: Event[NoEventData]) -> dict[str, str]:
-        """Describe homeassistant logbook event."""
-        speed = event.data.get("speed")
+        """Describe the position changes of a group within a window."""
+        speed = event.data.get(ATTR_SPEED)
+        start_speed = event.data.get(ATTR_START_SPEED)
+        message = (
+            f"speed changed to {speed}"
+            if start_speed is None
+            else f"speed changed from {start_speed} to {speed}"
+        )
         return {
             LOGBOOK_ENTRY_NAME: event.data.get(ATTR_NAME),
             LOGBOOK_ENTRY_ENTITY_ID: event.data.get(ATTR_ENTITY_ID),
-            LOGBOOK_ENTRY_MESSAGE: f"speed changed to {speed}",
+            LOGBOOK_ENTRY_MESSAGE: message,
             LOGBOOK_ENTRY_ICON: "mdi:fan",
         }
 
+    @callback
+    def async_describe_rollback_event(event: Event[NoEventData]) -> dict[str, str]:
+        """Describe a rolled back fan command."""
+        return {
+            LOGBOOK_ENTRY_NAME: event.data.get(ATTR_NAME),
+            LOGBOOK_ENTRY_ENTITY_ID: event.data.get(ATTR_ENTITY_ID),
+            LOGBOOK_ENTRY_MESSAGE: (
+                f"change to {event.data.get(ATTR_SPEED)} was not confirmed"
+                f" ({event.data.get(ATTR_REASON)})"
+            ),
+            LOGBOOK_ENTRY_ICON: "mdi:fan-alert",
+        }
+
     async_describe_event(
         DOMAIN, EVENT_ZONETOUCH3_FAN_PERCENTAGE, async_describe_hass_event
     )
+    async_describe_event(
+        DOMAIN, EVENT_ZONETOUCH3_FAN_ROLLBACK, async_describe_rollback_event
+    )
@@ -1,6 +1,10 @@
 """Sensor entity."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -8,15 +12,20 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DOMAIN
 from .data import ZoneTouch3ConfigEntry
 from .entity import ZoneTouch3DataUpdateCoordinator, ZoneTouch3Entity
+from .zonetouch.metrics import ZoneTouchMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Diagnostic sensors read the client metrics at this interval
+SCAN_INTERVAL = timedelta(seconds=30)
+
 ENTITY_DESCRIPTIONS = (
     SensorEntityDescription(
         key="_panel_temperature",
@@ -26,6 +35,73 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class ZoneTouch3DiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reading the client metrics."""
+
+    value_fn: Callable[[ZoneTouchMetrics], Any]
+    attributes_fn: Callable[[ZoneTouchMetrics], dict[str, Any]] | None = None
+
+
+def _round_trip_ms(metrics: ZoneTouchMetrics) -> float | None:
+    """Return the mean command round trip time in milliseconds."""
+    mean = metrics.round_trip_total().mean
+    return None if mean is None else round(mean * 1000, 1)
+
+
+DIAGNOSTIC_ENTITY_DESCRIPTIONS = (
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="command_round_trip",
+        name="Command Round Trip",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_round_trip_ms,
+        attributes_fn=lambda metrics: metrics.snapshot()["round_trip"],
+    ),
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="command_timeouts",
+        name="Command Timeouts",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.timeouts,
+    ),
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="send_queue_depth",
+        name="Send Queue Depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.queue_depth,
+        attributes_fn=lambda metrics: {
+            "max_queue_depth": metrics.max_queue_depth,
+            "dropped": metrics.dropped,
+        },
+    ),
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="frames_received",
+        name="Frames Received",
+        icon="mdi:message-arrow-left-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.frames_received,
+        attributes_fn=lambda metrics: metrics.snapshot()["frames"],
+    ),
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="crc_failures",
+        name="CRC Failures",
+        icon="mdi:message-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.crc_failures,
+    ),
+    ZoneTouch3DiagnosticSensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        icon="mdi:lan-disconnect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.reconnects,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ZoneTouch3ConfigEntry,
@@ -39,6 +115,13 @@ async def async_setup_entry(
         )
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        ZoneTouch3DiagnosticSensorEntity(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in DIAGNOSTIC_ENTITY_DESCRIPTIONS
+    )
 
 
 class ZoneTouch3SensorEntity(ZoneTouch3Entity, SensorEntity):
@@ -54,7 +137,7 @@ class ZoneTouch3SensorEntity(ZoneTouch3Entity, SensorEntity):
         entity_description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, None, frozenset({"temperature"}))
         self.entity_description = entity_description
 
     def _handle_coordinator_update(self) -> None:
@@ -65,3 +148,51 @@ class ZoneTouch3SensorEntity(ZoneTouch3Entity, SensorEntity):
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
         return self.coordinator.data.temperature
+
+
+class ZoneTouch3DiagnosticSensorEntity(ZoneTouch3Entity, SensorEntity):
+    """Client metrics sensor class.
+
+    The metrics change with every frame, so these sensors are polled instead
+    of being written from the coordinator.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: ZoneTouch3DiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ZoneTouch3DataUpdateCoordinator,
+        entity_description: ZoneTouch3DiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, None, frozenset())
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{DOMAIN}_{entity_description.key}"
+        )
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll the client metrics."""
+        return True
+
+    async def async_update(self) -> None:
+        """Read the metrics in the state properties, not from the controller."""
+
+    @property
+    def _metrics(self) -> ZoneTouchMetrics:
+        """Return the client metrics."""
+        return self.coordinator.config_entry.runtime_data.client.metrics
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the metrics detail."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._metrics)
@@ -0,0 +1,211 @@
+"""Services for Zone Touch 3."""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import ATTR_CONFIG_ENTRY_ID, ATTR_ON, ATTR_POSITION, ATTR_ZONES, DOMAIN
+from .data import ZoneTouch3ConfigEntry, async_get_manager
+from .zonetouch.enums import GroupControl
+from .zonetouch.exceptions import ZoneTouch3Exception
+from .zonetouch.group import GroupPowerStatus, ZoneTouch3Group
+from .zonetouch.messages.group import GroupCommand
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_ZONES = "set_zones"
+
+# Unique id of a fan after the config entry id prefix
+FAN_UNIQUE_ID = re.compile(rf"{DOMAIN}_fan_(\d+)")
+
+POSITION = vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
+
+ZONE_SCHEMA = vol.Any(
+    POSITION,
+    vol.All(
+        {
+            vol.Optional(ATTR_POSITION): POSITION,
+            vol.Optional(ATTR_ON): cv.boolean,
+        },
+        cv.has_at_least_one_key(ATTR_POSITION, ATTR_ON),
+    ),
+)
+
+SET_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ZONES): vol.All(
+            {vol.Any(cv.entity_id, vol.Coerce(int)): ZONE_SCHEMA},
+            vol.Length(min=1),
+        ),
+    }
+)
+
+# Group control, position and expected on state of a group, None when the
+# control leaves the on state as is
+ZoneControl = tuple[GroupControl, int, bool | None]
+
+
+def _zone_control(zone: int | dict[str, Any]) -> ZoneControl:
+    """Return the group control setting a zone to the requested state.
+
+    Turning a zone off wins over a position, a position alone leaves the zone
+    on or off like the fan entity, and on alone opens the zone at its last
+    position.
+    """
+    if isinstance(zone, int):
+        return GroupControl.SET_POSITION, zone, None
+    if zone.get(ATTR_ON) is False:
+        return GroupControl.CLOSE, 0, False
+    if (position := zone.get(ATTR_POSITION)) is not None:
+        return GroupControl.SET_POSITION, position, None
+    return GroupControl.OPEN, 0, True
+
+
+def _is_confirmed(group: ZoneTouch3Group | None, control: ZoneControl) -> bool:
+    """Return true if the echoed group has the requested state."""
+    group_control, position, is_on = control
+    return (
+        group is not None
+        and (is_on is None or (group.status == GroupPowerStatus.ON) == is_on)
+        and (group_control != GroupControl.SET_POSITION or group.position == position)
+    )
+
+
+def _loaded_entry(hass: HomeAssistant, entry_id: str | None) -> ZoneTouch3ConfigEntry:
+    """Return the config entry a zone given by group id belongs to."""
+    if entry_id is not None:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            raise ServiceValidationError(f"No loaded controller {entry_id}")
+        return entry
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    if len(entries) != 1:
+        raise ServiceValidationError(
+            f"Zones given by group id need a {ATTR_CONFIG_ENTRY_ID}"
+            f" when {len(entries)} controllers are loaded"
+        )
+    return entries[0]
+
+
+def _resolve_zone(
+    hass: HomeAssistant, registry: er.EntityRegistry, entry_id: str | None, zone: Any
+) -> tuple[ZoneTouch3ConfigEntry, int]:
+    """Return the config entry and group id of a group id or fan entity."""
+    if isinstance(zone, int):
+        return _loaded_entry(hass, entry_id), zone
+    entity = registry.async_get(zone)
+    if (
+        entity is None
+        or entity.platform != DOMAIN
+        or entity.config_entry_id is None
+        or not entity.unique_id.startswith(f"{entity.config_entry_id}_")
+        or (
+            match := FAN_UNIQUE_ID.fullmatch(
+                entity.unique_id.removeprefix(f"{entity.config_entry_id}_")
+            )
+        )
+        is None
+    ):
+        raise ServiceValidationError(f"{zone} is not a Zone Touch 3 fan")
+    return _loaded_entry(hass, entity.config_entry_id), int(match.group(1))
+
+
+def _controller_controls(
+    entry: ZoneTouch3ConfigEntry, zones: dict[int, int | dict[str, Any]]
+) -> dict[int, ZoneControl]:
+    """Return the group control of each zone of one controller."""
+    groups = entry.runtime_data.client.state.groups
+    controls: dict[int, ZoneControl] = {}
+    for group_id, zone in zones.items():
+        if group_id not in groups:
+            raise ServiceValidationError(f"{entry.title} has no zone {group_id}")
+        controls[group_id] = _zone_control(zone)
+    return controls
+
+
+def _group_records(
+    controls: dict[int, ZoneControl],
+) -> list[tuple[int, GroupControl, int]]:
+    """Return the group control records of the zones of one controller."""
+    return [
+        (group_id, group_control, position)
+        for group_id, (group_control, position, _) in controls.items()
+    ]
+
+
+def _check_reply(
+    entry: ZoneTouch3ConfigEntry, controls: dict[int, ZoneControl], reply: Any
+) -> str | None:
+    """Return why the reply of a controller does not confirm its zones."""
+    if isinstance(reply, (TimeoutError, ZoneTouch3Exception)):
+        return f"{entry.title} failed: {reply!r}"
+    if isinstance(reply, BaseException):
+        raise reply
+    if unconfirmed := [
+        group_id
+        for group_id, control in controls.items()
+        if not _is_confirmed(reply.groups.get(group_id), control)
+    ]:
+        return (
+            f"{entry.title} did not confirm zones {', '.join(map(str, unconfirmed))}"
+        )
+    return None
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Zone Touch 3 services."""
+
+    async def async_set_zones(call: ServiceCall) -> None:
+        """Set the position and on state of many zones at once.
+
+        The zones of each controller are sent as one packet, to all
+        controllers in parallel, and the service returns once the echo of
+        every controller confirmed them.
+        """
+        registry = er.async_get(hass)
+        entries: dict[str, ZoneTouch3ConfigEntry] = {}
+        zones: dict[str, dict[int, int | dict[str, Any]]] = {}
+        for zone, state in call.data[ATTR_ZONES].items():
+            entry, group_id = _resolve_zone(
+                hass, registry, call.data.get(ATTR_CONFIG_ENTRY_ID), zone
+            )
+            entries[entry.entry_id] = entry
+            zones.setdefault(entry.entry_id, {})[group_id] = state
+
+        controls = {
+            entry_id: _controller_controls(entries[entry_id], controller_zones)
+            for entry_id, controller_zones in zones.items()
+        }
+
+        _LOGGER.debug("Setting zones %s", controls)
+        replies = await async_get_manager(hass).fan_out(
+            lambda entry_id, client: GroupCommand().build_packet(
+                _group_records(controls[entry_id]), client.next_msg_id()
+            ),
+            controls,
+        )
+        errors = []
+        for entry_id, reply in replies.items():
+            if error := _check_reply(entries[entry_id], controls[entry_id], reply):
+                errors.append(error)
+        if errors:
+            raise HomeAssistantError("; ".join(errors))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_ZONES, async_set_zones, schema=SET_ZONES_SCHEMA
+    )
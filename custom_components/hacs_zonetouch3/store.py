@@ -0,0 +1,51 @@
+"""Persisted state for Zone Touch 3."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .zonetouch.state import ZoneTouch3State
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class ZoneTouch3StateStore:
+    """Keep the last known controller state on disk.
+
+    Entities are created from the stored state at startup, so Home Assistant
+    does not wait for the controller before setting up the platforms.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Init the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+
+    async def async_load(self) -> ZoneTouch3State | None:
+        """Load the stored state."""
+        data = await self._store.async_load()
+        if data is None:
+            return None
+        try:
+            return ZoneTouch3State.from_dict(data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid stored state: %s", err)
+            return None
+
+    @callback
+    def async_schedule_save(self, state: ZoneTouch3State) -> None:
+        """Save the state after a short delay."""
+        self._store.async_delay_save(state.as_dict, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored state."""
+        await self._store.async_remove()
@@ -0,0 +1,142 @@
+"""ZoneTouch 3 frame capture."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from pathlib import Path
+import struct
+import time
+from typing import BinaryIO
+
+from .enums import CaptureDirection
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"ZTCAP\x00\x01\n"
+# Timestamp in microseconds, direction and frame length, followed by the frame
+CAPTURE_RECORD = struct.Struct(">QBH")
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 2
+FLUSH_BYTES = 16 * 1024
+FLUSH_INTERVAL = 1.0
+
+
+class ZoneTouchCapture:
+    """Write raw frames to a size bounded, rotating capture file.
+
+    Frames are collected in memory and written by a single worker thread,
+    so capturing never blocks the event loop. When the file would grow past
+    ``max_bytes``, and when a capture is started, an existing file is
+    renamed to ``<path>.1``, older files move up and files past
+    ``backup_count`` are deleted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ) -> None:
+        """Init the capture, the file is opened on the first write."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._buffer = bytearray()
+        self._flushed_at = time.monotonic()
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def write(self, direction: CaptureDirection, frame: bytes) -> None:
+        """Add a frame to the capture."""
+        self._buffer += CAPTURE_RECORD.pack(
+            time.time_ns() // 1000, direction.value, len(frame)
+        )
+        self._buffer += frame
+        now = time.monotonic()
+        if len(self._buffer) >= FLUSH_BYTES or now - self._flushed_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the collected frames to the writer thread."""
+        self._flushed_at = time.monotonic()
+        if self._buffer:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="zonetouch capture"
+                )
+            self._executor.submit(self._write_records, data)
+
+    def close(self) -> None:
+        """Write the remaining frames, close the file and stop the writer thread.
+
+        Blocks until the frames are written. Writing again starts a new file.
+        """
+        self.flush()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.submit(self._close_file)
+            executor.shutdown(wait=True)
+
+    def _write_records(self, data: bytes) -> None:
+        """Write records to the file, rotating it at record boundaries."""
+        try:
+            offset = 0
+            while offset < len(data):
+                length = CAPTURE_RECORD.unpack_from(data, offset)[2]
+                end = offset + CAPTURE_RECORD.size + length
+                record = data[offset:end]
+                file = self._file
+                if file is None or self._size + len(record) > self.max_bytes:
+                    file = self._rotate()
+                file.write(record)
+                self._size += len(record)
+                offset = end
+            if self._file is not None:
+                self._file.flush()
+        except OSError as err:
+            _LOGGER.warning("Failed to write capture %s: %s", self.path, err)
+
+    def _rotate(self) -> BinaryIO:
+        """Start a new capture file, moving an existing one to a backup."""
+        if self._file is not None:
+            self._file.close()
+        if self.path.exists():
+            names = [
+                self.path.name,
+                *(f"{self.path.name}.{n}" for n in range(1, self.backup_count + 1)),
+            ]
+            for source, target in reversed(list(zip(names, names[1:]))):
+                if (source_path := self.path.with_name(source)).exists():
+                    source_path.replace(self.path.with_name(target))
+        self._file = self.path.open("wb")
+        self._file.write(CAPTURE_MAGIC)
+        self._size = len(CAPTURE_MAGIC)
+        return self._file
+
+    def _close_file(self) -> None:
+        """Close the capture file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_capture(path: str | Path) -> Iterator[tuple[float, CaptureDirection, bytes]]:
+    """Yield the timestamp, direction and frame of every captured frame."""
+    data = Path(path).read_bytes()
+    if not data.startswith(CAPTURE_MAGIC):
+        raise ValueError(f"{path} is not a ZoneTouch capture")
+    offset = len(CAPTURE_MAGIC)
+    while offset + CAPTURE_RECORD.size <= len(data):
+        timestamp, direction, length = CAPTURE_RECORD.unpack_from(data, offset)
+        offset += CAPTURE_RECORD.size
+        if offset + length > len(data):
+            # Truncated by a crash while writing
+            break
+        end = offset + length
+        yield timestamp / 1e6, CaptureDirection(direction), data[offset:end]
+        offset = end
@@ -0,0 +1,151 @@
+"""ZoneTouch 3 packet codec.
+
+Precompiled structures and the CRC shared by every packet builder and parser.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import struct
+
+from .enums import Protocol
+
+FRAME_HEADER = bytes(
+    (
+        Protocol.PROTOCOL_HEAD_S.value,
+        Protocol.PROTOCOL_HEAD_S.value,
+        Protocol.PROTOCOL_HEAD_S.value,
+        Protocol.PROTOCOL_HEAD_E.value,
+    )
+)
+
+# Header, destination, source, message id, message type, data length
+HEADER = struct.Struct(">IBBBBH")
+# Address, message id, message type, data length (the CRC covered part)
+ADDRESS = struct.Struct(">BBBBH")
+# Sub message type, reserved, reserved, record length, record count
+SUBCOMMAND = struct.Struct(">BBHHH")
+DATA_LENGTH = struct.Struct(">H")
+CRC = struct.Struct(">H")
+UINT16 = struct.Struct(">H")
+
+HEADER_SIZE = HEADER.size
+SUBCOMMAND_OFFSET = HEADER_SIZE
+SUBCOMMAND_DATA_OFFSET = HEADER_SIZE + SUBCOMMAND.size
+CRC_SIZE = CRC.size
+
+CRC16_INIT = 0xFFFF
+
+
+def _build_crc16_table() -> tuple[int, ...]:
+    """Build the lookup table for the reflected modbus polynomial."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_crc16_table()
+
+
+def crc16(data: bytes | bytearray | memoryview, crc: int = CRC16_INIT) -> int:
+    """Calculate the modbus CRC16 of data.
+
+    Pass the result of a previous call as ``crc`` to continue the checksum
+    over data that follows it.
+    """
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+@lru_cache(maxsize=None)
+def _crc16_shift_tables(length: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Build the tables that advance a CRC over ``length`` zero bytes.
+
+    The CRC is linear, so the checksum of known data from any start value is
+    the checksum from zero combined with the start value advanced over the
+    same number of zero bytes, one table per start value byte.
+    """
+    zeros = bytes(length)
+    return (
+        tuple(crc16(zeros, crc) for crc in range(256)),
+        tuple(crc16(zeros, crc << 8) for crc in range(256)),
+    )
+
+
+def check_crc(frame: bytes | bytearray | memoryview) -> bool:
+    """Validate the checksum in the last 2 bytes of a frame."""
+    if len(frame) < HEADER_SIZE + CRC_SIZE:
+        return False
+    with memoryview(frame) as view:
+        return crc16(view[4:-2]) == CRC.unpack_from(view, len(view) - CRC_SIZE)[0]
+
+
+def encode_frame(
+    addr_dest: int, addr_src: int, msg_id: int, message_type: int, data: bytes
+) -> bytes:
+    """Encode a complete frame with header and checksum."""
+    body = ADDRESS.pack(addr_dest, addr_src, msg_id, message_type, len(data)) + data
+    return FRAME_HEADER + body + CRC.pack(crc16(body))
+
+
+def replace_msg_id(frame: bytes, msg_id: int) -> bytes:
+    """Return a copy of an encoded frame with another message id."""
+    patched = bytearray(frame)
+    patched[6] = msg_id
+    CRC.pack_into(patched, len(patched) - CRC_SIZE, crc16(patched[4:-2]))
+    return bytes(patched)
+
+
+def encode_subcommand(
+    sub_message_type: int, record_length: int, count: int, records: bytes
+) -> bytes:
+    """Encode the data of a sub command message."""
+    return SUBCOMMAND.pack(sub_message_type, 0, 0, record_length, count) + records
+
+
+class FrameTemplate:
+    """A frame with fixed content where only the message id changes.
+
+    The checksum of the bytes around the message id is computed once, so
+    building a frame only patches the id and combines the checksums.
+    """
+
+    __slots__ = (
+        "_frame",
+        "_prefix_crc",
+        "_shift_high",
+        "_shift_low",
+        "_suffix_crc",
+    )
+
+    def __init__(
+        self, addr_dest: int, addr_src: int, message_type: int, data: bytes
+    ) -> None:
+        """Init the template."""
+        self._frame = bytearray(
+            encode_frame(addr_dest, addr_src, 0, message_type, data)
+        )
+        suffix = self._frame[7:-2]
+        self._prefix_crc = crc16(self._frame[4:6])
+        self._suffix_crc = crc16(suffix, 0)
+        self._shift_low, self._shift_high = _crc16_shift_tables(len(suffix))
+
+    def build(self, msg_id: int) -> bytes:
+        """Build the frame for a message id."""
+        frame = self._frame
+        frame[6] = msg_id
+        prefix_crc = self._prefix_crc
+        crc = (prefix_crc >> 8) ^ _CRC16_TABLE[(prefix_crc ^ msg_id) & 0xFF]
+        crc = (
+            self._suffix_crc
+            ^ self._shift_low[crc & 0xFF]
+            ^ self._shift_high[crc >> 8]
+        )
+        CRC.pack_into(frame, len(frame) - CRC_SIZE, crc)
+        return bytes(frame)
@@ -22,6 +22,8 @@ class Response(Enum):
     """Received command type."""
 
     NONE = 0x00
+    # Any sub message type not listed here, never sent by the controller
+    UNKNOWN = -1
     RESPONSE_GROUP_CONTROL = 0x21
     RESPONSE_GROUP_NAME = 0x43
     RESPONSE_FAVOURITE = 0x31
@@ -57,6 +59,28 @@ class Command(Enum):
     COMMAND_EXPAND = 0x1F
 
 
+class GroupControl(Enum):
+    """Group control record actions."""
+
+    CLOSE = 0x02
+    OPEN = 0x03
+    SET_POSITION = 0x80
+
+
+class CommandPriority(Enum):
+    """Send priority of a command, lower values are sent first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class CaptureDirection(Enum):
+    """Direction of a captured frame."""
+
+    RECEIVED = 0
+    SENT = 1
+
+
 class ExData(Enum):
     """Extended message data."""
 
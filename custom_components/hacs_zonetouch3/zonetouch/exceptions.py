@@ -0,0 +1,26 @@
+"""ZoneTouch 3 exceptions."""
+
+
+class ZoneTouch3Exception(Exception):
+    """Base class for errors throw by ZoneTouch3."""
+
+    def __init__(self, reason: str | None = None) -> None:
+        """Init the exception."""
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ZoneTouch3ClientError(ZoneTouch3Exception):
+    """Exception to indicate a general API error."""
+
+
+class ZoneTouch3ConnectionFailedException(ZoneTouch3Exception):
+    """Exception to indicate a general API error."""
+
+
+class ZoneTouch3CommandDroppedException(ZoneTouch3Exception):
+    """Exception to indicate a command was dropped before being sent."""
+
+
+class ZoneTouch3MessageIdsExhaustedException(ZoneTouch3Exception):
+    """Exception to indicate every message ID is in flight."""
@@ -0,0 +1,89 @@
+"""ZoneTouch 3 stream framer."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import logging
+
+from .codec import CRC_SIZE, DATA_LENGTH, FRAME_HEADER, HEADER_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+FRAME_MAX_DATA_LENGTH = 4096
+
+
+class ZoneTouchFramer:
+    """Split a TCP byte stream into ZoneTouch 3 frames.
+
+    Every frame starts with the ``55 55 55 AA`` sync header, followed by the
+    addresses, message id, message type and a big endian data length. The
+    framer syncs on the header and uses the length field to find the end of
+    the frame, so frames that were coalesced or split by TCP are rebuilt
+    before they are handed to the parser.
+    """
+
+    def __init__(self) -> None:
+        """Init the framer."""
+        self._buffer = bytearray()
+        self._start = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield every complete frame currently buffered."""
+        while (frame := self.next_frame()) is not None:
+            yield frame
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes not yet framed."""
+        return len(self._buffer) - self._start
+
+    def feed(self, data: bytes) -> None:
+        """Append received bytes to the buffer."""
+        if self._start:
+            # Drop consumed frames in one go instead of once per frame
+            del self._buffer[: self._start]
+            self._start = 0
+        self._buffer += data
+
+    def reset(self) -> None:
+        """Discard any buffered bytes, e.g. after a reconnect."""
+        self._buffer.clear()
+        self._start = 0
+
+    def next_frame(self) -> bytes | None:
+        """Return the next complete frame, or None if more data is needed."""
+        buffer = self._buffer
+        while True:
+            start = buffer.find(FRAME_HEADER, self._start)
+            if start < 0:
+                # Keep a possible partial header at the end of the buffer
+                self.__discard(max(self._start, len(buffer) - len(FRAME_HEADER) + 1))
+                return None
+            if start > self._start:
+                self.__discard(start)
+
+            if len(buffer) - start < HEADER_SIZE:
+                return None
+
+            (data_length,) = DATA_LENGTH.unpack_from(buffer, start + 8)
+            if data_length > FRAME_MAX_DATA_LENGTH:
+                _LOGGER.debug("Invalid frame length %d, resyncing", data_length)
+                self.__discard(start + 1)
+                continue
+
+            end = start + HEADER_SIZE + data_length + CRC_SIZE
+            if end > len(buffer):
+                return None
+
+            with memoryview(buffer) as view:
+                frame = view[start:end].tobytes()
+            self._start = end
+            return frame
+
+    def __discard(self, position: int) -> None:
+        """Skip bytes that can not be part of a frame."""
+        if position > self._start:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Discarding %s", self._buffer[self._start : position].hex()
+                )
+            self._start = position
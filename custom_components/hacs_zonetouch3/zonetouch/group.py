@@ -1,13 +1,53 @@
 """Group file."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 import struct
 from typing import Self
 
 from .enums import GroupPowerStatus
 
+# Group index and power, position, 4 unused bytes, sign, 1 unused byte
+GROUP_RECORD = struct.Struct(">BB4xBx")
+GROUP_SIGN_TURBO = 0x80
+GROUP_SIGN_SPILL = 0x02
 
-@dataclass
+# Group index and power, position and sign of each record
+GroupColumns = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]
+
+
+@lru_cache(maxsize=8)
+def _group_record_struct(stride: int) -> struct.Struct:
+    """Return a struct reading a group record padded to stride bytes."""
+    return struct.Struct(f"{GROUP_RECORD.format}{stride - GROUP_RECORD.size}x")
+
+
+def iter_group_records(
+    data: bytes | memoryview, count: int, stride: int, offset: int = 0
+) -> Iterator[tuple[int, int, int]]:
+    """Iterate over count group records of stride bytes starting at offset.
+
+    All records are read in one pass with struct.iter_unpack over a view of
+    the data, yielding the index, position and sign of each record.
+    """
+    if stride < GROUP_RECORD.size:
+        raise ValueError("Group records are too short")
+    end = offset + stride * max(count, 0)
+    if end > len(data):
+        raise ValueError("Group records past the end of the data")
+    return _group_record_struct(stride).iter_unpack(memoryview(data)[offset:end])
+
+
+def decode_group_records(
+    data: bytes | memoryview, count: int, stride: int, offset: int = 0
+) -> GroupColumns:
+    """Return the index, position and sign columns of count group records."""
+    columns = tuple(zip(*iter_group_records(data, count, stride, offset), strict=True))
+    return columns or ((), (), ())
+
+
+@dataclass(slots=True)
 class ZoneTouch3Group:
     """ZoneTouch3 Group class."""
 
@@ -23,7 +63,11 @@ class ZoneTouch3Group:
     def parse_group_names(cls, data: bytes, count: int, length: int) -> dict[int, str]:
         """Parse group names."""
         group_names: dict[int, str] = {}
+        if not data:
+            return group_names
         name_len: int = struct.unpack_from(">B", data)[0]
+        if count and (length * (count - 1)) + 3 + name_len > len(data):
+            raise ValueError("Group names past the end of the data")
         for x in range(count):
             (groupIndex, name) = struct.unpack_from(
                 f">B{name_len}s", data, (length * x) + 2
@@ -38,16 +82,13 @@ class ZoneTouch3Group:
     ) -> dict[int, Self]:
         """Parse groups."""
         groups: dict[int, Self] = {}
-        data_len = 8
-        for idx in range(count):
-            index: int = struct.unpack_from(">B", data, (data_len * idx) + 0)[0]
-            position = struct.unpack_from(">B", data, (data_len * idx) + 1)[0]
-            sign = struct.unpack_from(">B", data, (data_len * idx) + 6)[0]
-
+        for index, position, sign in iter_group_records(
+            data, count, GROUP_RECORD.size
+        ):
             groupIndex = index & 0x3F
             powerStatus = GroupPowerStatus(index >> 6)
-            is_support_turbo = (sign & 0x80) != 0
-            is_spill_on = (sign & 0x02) != 0
+            is_support_turbo = (sign & GROUP_SIGN_TURBO) != 0
+            is_spill_on = (sign & GROUP_SIGN_SPILL) != 0
 
             groups[groupIndex] = cls(
                 groupIndex,
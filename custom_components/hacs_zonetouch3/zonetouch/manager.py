@@ -0,0 +1,122 @@
+"""ZoneTouch 3 multi controller connection manager."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable, Iterator
+import logging
+from typing import Any
+
+from .enums import CommandPriority
+from .zonetouch import ZoneTouch
+
+_LOGGER = logging.getLogger(__name__)
+
+# Builds the packet sent to the controller of a key with its client
+PacketBuilder = Callable[[Hashable, ZoneTouch], bytes]
+
+
+class ZoneTouchManager:
+    """Connections to any number of ZoneTouch 3 controllers.
+
+    Every controller has its own ZoneTouch client, so message ids, the send
+    queue, the reconnect supervisor and the metrics are kept per controller
+    and a slow or offline controller never holds up the others. Each client
+    still runs its own listener, sender and supervisor task, the manager only
+    shares the lookup, the fan out of commands and the health report.
+    """
+
+    def __init__(self) -> None:
+        """Init the manager."""
+        self._clients: dict[Hashable, ZoneTouch] = {}
+
+    def __len__(self) -> int:
+        """Return the number of controllers."""
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the controller keys."""
+        return iter(self._clients)
+
+    def __contains__(self, key: object) -> bool:
+        """Return true if a controller is managed under key."""
+        return key in self._clients
+
+    def get(self, key: Hashable) -> ZoneTouch | None:
+        """Return the client of a controller."""
+        return self._clients.get(key)
+
+    def add(
+        self,
+        key: Hashable,
+        host: str,
+        port: int,
+        on_state_update: Callable,
+        on_disconnect: Callable,
+        **kwargs: Any,
+    ) -> ZoneTouch:
+        """Create the client of a controller.
+
+        The client is not started, keyword arguments are passed to ZoneTouch.
+        """
+        if key in self._clients:
+            raise ValueError(f"Controller {key} already added")
+        client = self._clients[key] = ZoneTouch(
+            host, port, on_state_update, on_disconnect, **kwargs
+        )
+        _LOGGER.debug("Added controller %s at %s:%s", key, host, port)
+        return client
+
+    async def remove(self, key: Hashable) -> None:
+        """Stop and forget the client of a controller."""
+        if (client := self._clients.pop(key, None)) is not None:
+            await client.stop()
+            _LOGGER.debug("Removed controller %s", key)
+
+    async def stop(self) -> None:
+        """Stop the clients of all controllers."""
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.stop() for client in clients.values()))
+
+    async def fan_out(
+        self,
+        build_packet: PacketBuilder,
+        keys: Iterable[Hashable] | None = None,
+        timeout: float | None = None,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+    ) -> dict[Hashable, Any]:
+        """Send a command to several controllers in parallel.
+
+        build_packet is called with the key and client of each controller, so
+        the packet can differ per controller and carries a message id of its
+        client. All controllers are targeted when no keys are given. Returns
+        the decoded reply of each controller, or the exception its request
+        failed with.
+        """
+        clients = {
+            key: self._clients[key]
+            for key in (self._clients if keys is None else keys)
+        }
+        results = await asyncio.gather(
+            *(
+                client.request(build_packet(key, client), timeout, priority)
+                for key, client in clients.items()
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(clients, results, strict=True))
+
+    def health(self) -> dict[Hashable, dict[str, Any]]:
+        """Return the connection health of every controller."""
+        return {
+            key: {
+                "connected": client.connected,
+                "queue_depth": client.metrics.queue_depth,
+                "pending": len(client.pending_commands),
+                "dropped": client.metrics.dropped,
+                "timeouts": client.metrics.timeouts,
+                "crc_failures": client.metrics.crc_failures,
+                "reconnects": client.metrics.reconnects,
+            }
+            for key, client in self._clients.items()
+        }
@@ -1,18 +1,35 @@
 """ZoneTouch 3 messages class."""
 
+from functools import cached_property
 import logging
 import struct
 
-import modbus_crc
-
+from .codec import (
+    CRC_SIZE,
+    HEADER,
+    HEADER_SIZE,
+    SUBCOMMAND,
+    SUBCOMMAND_DATA_OFFSET,
+    SUBCOMMAND_OFFSET,
+    check_crc,
+)
 from .enums import Address, MessageType, Response
 from .group import ZoneTouch3Group
+from .messages.spill import SPILL_MASK_OFFSET, parse_spill_groups
 
 _LOGGER = logging.getLogger(__name__)
 
+SENSOR_RECORD = struct.Struct(">BBH")
+EXPAND_DATA_OFFSET = 11
+
 
 class ZoneTouchMessage:
-    """ZoneTouch message class."""
+    """ZoneTouch message class.
+
+    The header is decoded when the message is created. The payload is a view
+    over the received frame and is only decoded when one of its fields is
+    accessed, so frames nobody looks at cost no more than a CRC check.
+    """
 
     def __init__(self, data: bytes | None = None) -> None:
         """Init the class."""
@@ -24,9 +41,10 @@ class ZoneTouchMessage:
         self.message_type: MessageType = MessageType.NONE
         self.sub_message_type: Response = Response.NONE
         self.length = None
-        self.message_data = b""
-        self.temperature: float = 0
-        self.groups: dict[int, ZoneTouch3Group] = {}
+        self.record_length: int = 0
+        self.count: int = 0
+        self.data = b""
+        self._data_offset = 0
 
         if data is None:
             return
@@ -34,60 +52,85 @@ class ZoneTouchMessage:
         self.data = data
         if self.__validate():
             self.__unpack_header()
-
-            match self.message_type:
-                case MessageType.MESSAGE_TYPE_SUBCOMMAND:
-                    (sub_message_type,) = struct.unpack_from(">B", self.data, 10)
+            if len(self.data) != HEADER_SIZE + self.length + CRC_SIZE:
+                raise ValueError("Frame length does not match its header")
+
+            if self.message_type == MessageType.MESSAGE_TYPE_SUBCOMMAND:
+                if self.length < SUBCOMMAND.size:
+                    raise ValueError("Sub command header past the end of the frame")
+                (sub_message_type, _, _, self.record_length, self.count) = (
+                    SUBCOMMAND.unpack_from(self.data, SUBCOMMAND_OFFSET)
+                )
+                if self.record_length * self.count > self.length - SUBCOMMAND.size:
+                    raise ValueError("Sub command records past the end of the frame")
+                try:
                     self.sub_message_type = Response(sub_message_type)
-                    (_, length, count) = struct.unpack_from(">HHH", self.data, 12)
-                    self.message_data = self.data[18:-2]
-
-                    match self.sub_message_type:
-                        case Response.RESPONSE_GROUP_CONTROL:
-                            _LOGGER.debug("RESPONSE_GROUP_CONTROL")
-                            groups = ZoneTouch3Group.parse_group_control(
-                                self.message_data, count, length
-                            )
-                            self.groups = groups
-                        case Response.RESPONSE_GROUP_NAME:
-                            _LOGGER.debug("RESPONSE_GROUP_NAME")
-                            group_names = ZoneTouch3Group.parse_group_names(
-                                self.message_data, count, length
-                            )
-                            for group_index, group_name in group_names.items():
-                                self.groups[group_index].name = group_name
-                        case Response.RESPONSE_FAVOURITE:
-                            _LOGGER.debug("RESPONSE_FAVOURITE")
-                        case Response.RESPONSE_PROGRAM:
-                            _LOGGER.debug("RESPONSE_PROGRAM")
-                        case Response.RESPONSE_ZONE_INFO:
-                            _LOGGER.debug("RESPONSE_ZONE_INFO")
-                        case Response.RESPONSE_GROUPING:
-                            _LOGGER.debug("RESPONSE_GROUPING")
-                        case Response.RESPONSE_SERVICE:
-                            _LOGGER.debug("RESPONSE_SERVICE")
-                        case Response.RESPONSE_PASSWORD:
-                            _LOGGER.debug("RESPONSE_PASSWORD")
-                        case Response.RESPONSE_NOTIFICATION:
-                            _LOGGER.debug("RESPONSE_NOTIFICATION")
-                        case Response.RESPONSE_SENSOR:
-                            _LOGGER.debug("RESPONSE_SENSOR")
-                            self.__unpack_sensor(count, length)
-                        case Response.RESPONSE_PREFERENCE:
-                            _LOGGER.debug("RESPONSE_PREFERENCE")
-                        case Response.RESPONSE_PARAMETERS:
-                            _LOGGER.debug("RESPONSE_PARAMETERS")
-                        case _:
-                            _LOGGER.debug("RESPONSE_UNKNOWN")
-                case _:
-                    self.message_data = self.data[11:-2]
-
-            _LOGGER.debug(Address(self.addrDest))
-            _LOGGER.debug(Address(self.addrSrc))
-            _LOGGER.debug(self.message_type)
-            _LOGGER.debug(self.sub_message_type)
-            _LOGGER.debug(self.data.hex())
-            _LOGGER.debug(self.message_data.hex())
+                except ValueError:
+                    # Counted and skipped by the listener rather than failing
+                    _LOGGER.debug("Unknown sub message type 0x%02x", sub_message_type)
+                    self.sub_message_type = Response.UNKNOWN
+                self._data_offset = SUBCOMMAND_DATA_OFFSET
+            else:
+                self._data_offset = EXPAND_DATA_OFFSET
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "<- %s %s %s %s %s",
+                    Address(self.addrDest),
+                    Address(self.addrSrc),
+                    self.message_type,
+                    self.sub_message_type,
+                    self.data.hex(),
+                )
+
+    @cached_property
+    def message_data(self) -> memoryview:
+        """Return the message payload without copying it."""
+        if not self.valid:
+            return memoryview(b"")
+        return memoryview(self.data)[self._data_offset : -CRC_SIZE]
+
+    @cached_property
+    def groups(self) -> dict[int, ZoneTouch3Group]:
+        """Return the groups of a group control message."""
+        if self.sub_message_type != Response.RESPONSE_GROUP_CONTROL:
+            return {}
+        return ZoneTouch3Group.parse_group_control(
+            self.message_data, self.count, self.record_length
+        )
+
+    @cached_property
+    def group_names(self) -> dict[int, str]:
+        """Return the group names of a group name message."""
+        if self.sub_message_type != Response.RESPONSE_GROUP_NAME:
+            return {}
+        return ZoneTouch3Group.parse_group_names(
+            self.message_data, self.count, self.record_length
+        )
+
+    @cached_property
+    def spill_groups(self) -> list[int]:
+        """Return the ids of the groups set as spill of a spill message."""
+        if self.sub_message_type != Response.RESPONSE_SPILL or self.count < 1:
+            return []
+        if len(self.message_data) < SPILL_MASK_OFFSET + 1:
+            raise ValueError("Spill record past the end of the frame")
+        return parse_spill_groups(self.message_data)
+
+    @cached_property
+    def temperature(self) -> float:
+        """Return the temperature of a sensor message."""
+        temperature: float = 0
+        if self.sub_message_type == Response.RESPONSE_SENSOR:
+            if self.count and self.record_length < SENSOR_RECORD.size:
+                raise ValueError("Sensor records are too short")
+            for x in range(self.count):
+                (addr, _, value) = SENSOR_RECORD.unpack_from(
+                    self.data, SUBCOMMAND_DATA_OFFSET + (self.record_length * x)
+                )
+                if addr == 159 and value >= 0:
+                    temperature = (value - 500) / 10
+        return temperature
 
     def __validate(self) -> bool:
         """Validate received data.
@@ -95,11 +138,7 @@ class ZoneTouchMessage:
         Each packet received from the controller contains a modbus checksum as the last 2 bytes.
         The data is hashed and the checksum validated against the expected checksum.
         """
-        data_msg = self.data[4:-2]
-        crc_orig = self.data[-2:]
-        crc_check = modbus_crc.crc16(data_msg)
-
-        self.valid = crc_orig[0] == crc_check[1] and crc_orig[1] == crc_check[0]
+        self.valid = check_crc(self.data)
         return self.valid
 
     def __unpack_header(self) -> None:
@@ -115,14 +154,5 @@ class ZoneTouchMessage:
             self.message_id,
             message_type,
             self.length,
-        ) = struct.unpack(">IBBBBH", self.data[:10])
+        ) = HEADER.unpack_from(self.data)
         self.message_type = MessageType(message_type)
-
-    def __unpack_sensor(self, count, length) -> None:
-        """Process received temperature sensor data."""
-        for x in range(count):
-            (addr, _, temperature) = struct.unpack_from(
-                ">BBH", self.data, 18 + (length * x)
-            )
-            if addr == 159 and temperature >= 0:
-                self.temperature = (temperature - 500) / 10
@@ -1,15 +1,20 @@
 """ZoneTouch 3 fullstate class."""
 
 import logging
-import struct
-
-import modbus_crc
 
+from ..codec import UINT16, FrameTemplate
 from ..enums import Address, Command, ExData
 from .command import CommandPacket
 
 _LOGGER = logging.getLogger(__name__)
 
+_TEMPLATE = FrameTemplate(
+    Address.ADDRESS_CONSOLE.value,
+    Address.ADDRESS_REMOTE.value,
+    Command.COMMAND_EXPAND.value,
+    UINT16.pack(ExData.EX_DATA_FULL_STATE.value),
+)
+
 
 class FullState(CommandPacket):
     """FullState class."""
@@ -20,18 +25,6 @@ class FullState(CommandPacket):
         self.addr_dest = Address.ADDRESS_CONSOLE
         self.command = Command.COMMAND_EXPAND
 
-    def build_packet(self) -> bytes:
-        """Build command packet."""
-        data = struct.pack(
-            ">BBB",
-            self.addr_dest.value,
-            self.addr_src.value,
-            CommandPacket.next_msg_id(),
-        )
-        data += struct.pack(">B", self.command.value)
-        data += struct.pack(">H", 2)
-        data += struct.pack(">H", ExData.EX_DATA_FULL_STATE.value)
-
-        crc = modbus_crc.crc16(data)
-
-        return self.build_header() + data + struct.pack("<BB", crc[1], crc[0])
+    def build_packet(self, msg_id: int) -> bytes:
+        """Build command packet with a message ID of the client sending it."""
+        return _TEMPLATE.build(msg_id)
@@ -1,12 +1,33 @@
 """ZoneTouch 3 group class."""
 
+from collections.abc import Iterable
+from functools import lru_cache
 import struct
 
-import modbus_crc
-
-from ..enums import Address, Command
+from ..codec import FrameTemplate, encode_frame, encode_subcommand
+from ..enums import Address, Command, GroupControl
 from .command import CommandPacket
 
+GROUP_CONTROL_RECORD = struct.Struct(">BBBx")
+
+
+@lru_cache(maxsize=512)
+def _single_group_template(
+    group_id: int, control: GroupControl, position: int
+) -> FrameTemplate:
+    """Return the cached template of a single group control packet."""
+    return FrameTemplate(
+        Address.ADDRESS_MAIN_BOARD.value,
+        Address.ADDRESS_REMOTE.value,
+        Command.COMMAND_GROUP_CONTROL.value >> 8,
+        encode_subcommand(
+            Command.COMMAND_GROUP_CONTROL.value % 256,
+            GROUP_CONTROL_RECORD.size,
+            1,
+            GROUP_CONTROL_RECORD.pack(group_id, control.value, position),
+        ),
+    )
+
 
 class GroupCommand(CommandPacket):
     """FullState class."""
@@ -17,40 +38,43 @@ class GroupCommand(CommandPacket):
         self.addr_dest = Address.ADDRESS_MAIN_BOARD
         self.command = Command.COMMAND_GROUP_CONTROL
 
-    def build_position_packet(self, group_id: int, position: int) -> bytes:
-        """Generate a packet to set the group to desired position."""
-        data = struct.pack(
-            ">BBB",
-            self.addr_dest.value,
-            self.addr_src.value,
-            CommandPacket.next_msg_id(),
-        )
-        data += struct.pack(">B", self.command.value >> 8)
-        data += struct.pack(">BBB", 0, 12, self.command.value % 256)
-        data += struct.pack(">BHHHBBBB", 0, 0, 4, 1, group_id, 0x80, position, 0)
-
-        crc = modbus_crc.crc16(data)
+    def build_packet(
+        self,
+        records: Iterable[tuple[int, GroupControl, int]],
+        msg_id: int,
+    ) -> bytes:
+        """Generate a packet controlling one or more groups.
 
-        return self.build_header() + data + struct.pack("<BB", crc[1], crc[0])
+        Each record is a tuple of group id, control action and position. The
+        controller accepts any number of records in a single packet.
+        """
+        records = list(records)
+        if len(records) == 1:
+            return _single_group_template(*records[0]).build(msg_id)
 
-    def build_closed_packet(self, group_id: int, closed: bool) -> bytes:
-        """Generate a packet to close the valve."""
-        valve = 0
-        if closed:
-            valve = 2
-        else:
-            valve = 3
-
-        data = struct.pack(
-            ">BBB",
+        return encode_frame(
             self.addr_dest.value,
             self.addr_src.value,
-            CommandPacket.next_msg_id(),
+            msg_id,
+            self.command.value >> 8,
+            encode_subcommand(
+                self.command.value % 256,
+                GROUP_CONTROL_RECORD.size,
+                len(records),
+                b"".join(
+                    GROUP_CONTROL_RECORD.pack(group_id, control.value, position)
+                    for group_id, control, position in records
+                ),
+            ),
         )
-        data += struct.pack(">B", self.command.value >> 8)
-        data += struct.pack(">BBB", 0, 12, self.command.value % 256)
-        data += struct.pack(">BHHHBBBB", 0, 0, 4, 1, group_id, valve, 0, 0)
 
-        crc = modbus_crc.crc16(data)
+    def build_position_packet(self, group_id: int, position: int, msg_id: int) -> bytes:
+        """Generate a packet to set the group to desired position."""
+        return self.build_packet(
+            [(group_id, GroupControl.SET_POSITION, position)], msg_id
+        )
 
-        return self.build_header() + data + struct.pack("<BB", crc[1], crc[0])
+    def build_closed_packet(self, group_id: int, closed: bool, msg_id: int) -> bytes:
+        """Generate a packet to close the valve."""
+        control = GroupControl.CLOSE if closed else GroupControl.OPEN
+        return self.build_packet([(group_id, control, 0)], msg_id)
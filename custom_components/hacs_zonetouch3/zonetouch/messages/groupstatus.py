@@ -0,0 +1,35 @@
+"""ZoneTouch 3 group status class."""
+
+import logging
+
+from ..codec import FrameTemplate, encode_subcommand
+from ..enums import Address, Command
+from .command import CommandPacket
+
+_LOGGER = logging.getLogger(__name__)
+
+_TEMPLATE = FrameTemplate(
+    Address.ADDRESS_MAIN_BOARD.value,
+    Address.ADDRESS_REMOTE.value,
+    Command.COMMAND_GROUP_STATUS.value >> 8,
+    encode_subcommand(Command.COMMAND_GROUP_STATUS.value % 256, 0, 0, b""),
+)
+
+
+class GroupStatus(CommandPacket):
+    """GroupStatus class.
+
+    The controller replies with a RESPONSE_GROUP_CONTROL record for every
+    group.
+    """
+
+    def __init__(self) -> None:
+        """Init GroupStatus."""
+        super().__init__()
+        self.addr_dest = Address.ADDRESS_MAIN_BOARD
+        self.addr_src = Address.ADDRESS_REMOTE
+        self.command = Command.COMMAND_GROUP_STATUS
+
+    def build_packet(self, msg_id: int) -> bytes:
+        """Build command packet with a message ID of the client sending it."""
+        return _TEMPLATE.build(msg_id)
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import logging
-import struct
 
-import modbus_crc
-
-from ..enums import Address, Command, ExData, Response
+from ..codec import (
+    SUBCOMMAND,
+    SUBCOMMAND_DATA_OFFSET,
+    SUBCOMMAND_OFFSET,
+    FrameTemplate,
+    encode_subcommand,
+)
+from ..enums import Address, Command, Response
 from .command import CommandPacket
 
 _LOGGER = logging.getLogger(__name__)
 
+# Offset of the spill group mask within a spill record
+SPILL_MASK_OFFSET = 2
+
+
+def parse_spill_groups(data: bytes) -> list[int]:
+    """Return the ids of the groups set as spill in a spill record."""
+    return [n for n in range(32) if (data[SPILL_MASK_OFFSET] >> n) & 1]
+
+
+_TEMPLATE = FrameTemplate(
+    Address.ADDRESS_MAIN_BOARD.value,
+    Address.ADDRESS_REMOTE.value,
+    Command.COMMAND_SPILL.value >> 8,
+    encode_subcommand(Command.COMMAND_SPILL.value % 256, 0, 0, b""),
+)
+
 
 class Spill(CommandPacket):
     """FullState class."""
@@ -30,27 +50,17 @@ class Spill(CommandPacket):
         spill.raw_message = raw_response
         if spill.validate():
             spill.unpack_header()
-            (sub_message_type,) = struct.unpack_from(">B", spill.raw_message, 10)
+            if len(raw_response) <= SUBCOMMAND_DATA_OFFSET + SPILL_MASK_OFFSET + 2:
+                return None
+            (sub_message_type, _, _, length, count) = SUBCOMMAND.unpack_from(
+                spill.raw_message, SUBCOMMAND_OFFSET
+            )
             spill.sub_message_type = Response(sub_message_type)
-            (_, length, count) = struct.unpack_from(">HHH", spill.raw_message, 12)
-            spill.message_data = spill.raw_message[18:-2]
-            spill.groups = [n for n in range(32) if (spill.message_data[2] >> n) & 1]
+            spill.message_data = spill.raw_message[SUBCOMMAND_DATA_OFFSET:-2]
+            spill.groups = parse_spill_groups(spill.message_data)
             return spill
         return None
 
-    def build_packet(self) -> bytes:
-        """Build command packet."""
-        data = struct.pack(
-            ">BBB",
-            self.addr_dest.value,
-            self.addr_src.value,
-            CommandPacket.next_msg_id(),
-        )
-        data += struct.pack(">B", self.command.value >> 8)
-        data += struct.pack(">H", 8)
-        data += struct.pack(">B", self.command.value % 256)
-        data += struct.pack(">BHHH", 0, 0, 0, 0)
-
-        crc = modbus_crc.crc16(data)
-
-        return self.build_header() + data + struct.pack("<BB", crc[1], crc[0])
+    def build_packet(self, msg_id: int) -> bytes:
+        """Build command packet with a message ID of the client sending it."""
+        return _TEMPLATE.build(msg_id)
@@ -0,0 +1,160 @@
+"""ZoneTouch 3 protocol metrics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from .enums import Command, Response
+
+# Upper bounds of the round trip time buckets in seconds
+ROUND_TRIP_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class ZoneTouchHistogram:
+    """Fixed bucket histogram."""
+
+    __slots__ = ("buckets", "count", "counts", "total")
+
+    def __init__(self, buckets: tuple[float, ...] = ROUND_TRIP_BUCKETS) -> None:
+        """Init the histogram."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of all values."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, quantile: float) -> float | None:
+        """Return the upper bound of the bucket holding the quantile."""
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": dict(
+                zip((*self.buckets, float("inf")), self.counts, strict=True)
+            ),
+        }
+
+
+class ZoneTouchMetrics:
+    """Counters and histograms of a ZoneTouch connection.
+
+    Updating a metric is a dict lookup and an integer add, so the listener
+    and send queue can record every frame.
+    """
+
+    def __init__(
+        self,
+        queue_depth: Callable[[], int] | None = None,
+        dropped: Callable[[], int] | None = None,
+    ) -> None:
+        """Init the metrics."""
+        self._queue_depth = queue_depth
+        self._dropped = dropped
+        self.round_trip: dict[int, ZoneTouchHistogram] = {}
+        self.frames: Counter[Response] = Counter()
+        self.commands = 0
+        self.timeouts = 0
+        self.crc_failures = 0
+        self.reconnects = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting to be sent."""
+        return self._queue_depth() if self._queue_depth else 0
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of commands dropped by the scheduler."""
+        return self._dropped() if self._dropped else 0
+
+    @property
+    def frames_received(self) -> int:
+        """Return the total number of frames received."""
+        return self.frames.total()
+
+    def command_queued(self) -> None:
+        """Record the queue depth after a command was queued."""
+        depth = self.queue_depth
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+    def command_completed(self, command: int, round_trip: float) -> None:
+        """Record the round trip time of a command."""
+        self.commands += 1
+        histogram = self.round_trip.get(command)
+        if histogram is None:
+            histogram = self.round_trip[command] = ZoneTouchHistogram()
+        histogram.observe(round_trip)
+
+    def round_trip_total(self) -> ZoneTouchHistogram:
+        """Return the round trip histogram of all command types."""
+        total = ZoneTouchHistogram()
+        for histogram in self.round_trip.values():
+            total.count += histogram.count
+            total.total += histogram.total
+            total.counts = [
+                a + b for a, b in zip(total.counts, histogram.counts, strict=True)
+            ]
+        return total
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as a dict."""
+        return {
+            "commands": self.commands,
+            "round_trip": {
+                _command_name(command): histogram.snapshot()
+                for command, histogram in self.round_trip.items()
+            },
+            "timeouts": self.timeouts,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "dropped": self.dropped,
+            "frames_received": self.frames_received,
+            "frames": {
+                response.name: count for response, count in self.frames.items()
+            },
+            "crc_failures": self.crc_failures,
+            "reconnects": self.reconnects,
+        }
+
+
+def command_type(data: bytes) -> int:
+    """Return the Command value of an encoded packet."""
+    if data[7] == Command.COMMAND_EXPAND.value:
+        return data[7]
+    return (data[7] << 8) | data[10]
+
+
+def _command_name(command: int) -> str:
+    """Return a readable name for a Command value."""
+    try:
+        return Command(command).name
+    except ValueError:
+        return f"0x{command:04X}"
@@ -0,0 +1,60 @@
+"""ZoneTouch 3 message ID allocator."""
+
+from __future__ import annotations
+
+from .exceptions import ZoneTouch3MessageIdsExhaustedException
+
+MSG_ID_MIN = 1
+MSG_ID_MAX = 255
+
+
+class ZoneTouchMessageIdAllocator:
+    """Message IDs of a single connection.
+
+    IDs are handed out in turn and skip the IDs of commands still waiting
+    for their reply, so a wrapped counter never reuses a live ID.
+    """
+
+    __slots__ = ("_in_flight", "_next")
+
+    def __init__(self) -> None:
+        """Init the allocator."""
+        self._next = MSG_ID_MIN
+        self._in_flight: set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of IDs in flight."""
+        return len(self._in_flight)
+
+    def __contains__(self, msg_id: object) -> bool:
+        """Return true if the ID is in flight."""
+        return msg_id in self._in_flight
+
+    def next(self) -> int:
+        """Return the next ID not in flight, without reserving it.
+
+        Raises ZoneTouch3MessageIdsExhaustedException when every ID is in
+        flight.
+        """
+        in_flight = self._in_flight
+        if len(in_flight) >= MSG_ID_MAX - MSG_ID_MIN + 1:
+            raise ZoneTouch3MessageIdsExhaustedException("All message IDs in flight")
+        msg_id = self._next
+        while msg_id in in_flight:
+            msg_id = msg_id % MSG_ID_MAX + MSG_ID_MIN
+        self._next = msg_id % MSG_ID_MAX + MSG_ID_MIN
+        return msg_id
+
+    def acquire(self, msg_id: int) -> int:
+        """Reserve an ID until it is released.
+
+        The given ID is reserved when it is free, otherwise the next free one.
+        """
+        if msg_id in self._in_flight or not MSG_ID_MIN <= msg_id <= MSG_ID_MAX:
+            msg_id = self.next()
+        self._in_flight.add(msg_id)
+        return msg_id
+
+    def release(self, msg_id: int) -> None:
+        """Release a reserved ID."""
+        self._in_flight.discard(msg_id)
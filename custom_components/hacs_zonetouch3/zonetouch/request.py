@@ -0,0 +1,104 @@
+"""ZoneTouch 3 request class."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .enums import Command, CommandPriority, MessageType, Response
+from .message import ZoneTouchMessage
+from .messages.spill import Spill
+from .metrics import command_type
+from .state import ZoneTouch3State
+
+ReplyDecoder = Callable[[ZoneTouchMessage], Any]
+
+
+def _decode_state(msg: ZoneTouchMessage) -> ZoneTouch3State:
+    """Decode a full state reply."""
+    return ZoneTouch3State.from_bytes(msg.data)
+
+
+def _decode_spill(msg: ZoneTouchMessage) -> Spill | None:
+    """Decode a spill reply."""
+    return Spill.from_bytes(msg.data)
+
+
+# Reply type and decoder of each command, replies without a decoder are
+# returned as a ZoneTouchMessage
+REPLIES: dict[int, tuple[MessageType, Response, ReplyDecoder | None]] = {
+    Command.COMMAND_EXPAND.value: (
+        MessageType.MESSAGE_TYPE_EXPAND,
+        Response.NONE,
+        _decode_state,
+    ),
+    Command.COMMAND_SPILL.value: (
+        MessageType.MESSAGE_TYPE_SUBCOMMAND,
+        Response.RESPONSE_SPILL,
+        _decode_spill,
+    ),
+    Command.COMMAND_GROUP_CONTROL.value: (
+        MessageType.MESSAGE_TYPE_SUBCOMMAND,
+        Response.RESPONSE_GROUP_CONTROL,
+        None,
+    ),
+    Command.COMMAND_GROUP_STATUS.value: (
+        MessageType.MESSAGE_TYPE_SUBCOMMAND,
+        Response.RESPONSE_GROUP_CONTROL,
+        None,
+    ),
+    Command.COMMAND_GROUP_NAME.value: (
+        MessageType.MESSAGE_TYPE_SUBCOMMAND,
+        Response.RESPONSE_GROUP_NAME,
+        None,
+    ),
+}
+
+
+@dataclass(slots=True)
+class ZoneTouchRequest:
+    """A command waiting to be sent or for its reply.
+
+    The reply is matched by message id and type, so pushed frames sharing
+    the message id are never taken for a reply. Commands without a known
+    reply type are matched by message id only. The deadline of the command
+    is set on its future when it is queued.
+    """
+
+    data: bytes
+    future: asyncio.Future[Any]
+    priority: CommandPriority = CommandPriority.INTERACTIVE
+    queued_at: float = 0.0
+    command: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Set the command type."""
+        self.command = command_type(self.data)
+
+    @property
+    def msg_id(self) -> int:
+        """Return the message id of the command."""
+        return self.data[6]
+
+    def matches(self, msg: ZoneTouchMessage) -> bool:
+        """Return true if the message is the reply to this request."""
+        if msg.message_id != self.msg_id:
+            return False
+        reply = REPLIES.get(self.command)
+        return reply is None or (
+            reply[0] == msg.message_type and reply[1] == msg.sub_message_type
+        )
+
+    def resolve(self, msg: ZoneTouchMessage) -> None:
+        """Complete the request with its decoded reply."""
+        if self.future.done():
+            return
+        reply = REPLIES.get(self.command)
+        try:
+            result = reply[2](msg) if reply and reply[2] else msg
+        except Exception as err:  # noqa: BLE001
+            self.future.set_exception(err)
+        else:
+            self.future.set_result(result)
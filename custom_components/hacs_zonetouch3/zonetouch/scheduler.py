@@ -0,0 +1,151 @@
+"""ZoneTouch 3 command scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+
+from .enums import CommandPriority
+from .exceptions import ZoneTouch3CommandDroppedException
+from .request import ZoneTouchRequest
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_MAX_AGE = 30.0
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 8
+
+
+class ZoneTouchTokenBucket:
+    """Token bucket rate limit."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Init the bucket, starting full."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated: float | None = None
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        if self._updated is not None:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """Return the time until a token is available."""
+        self._refill(now)
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """Take a token."""
+        self._refill(now)
+        self._tokens -= 1
+
+
+class ZoneTouchScheduler:
+    """Command queue with priority lanes and a rate limit.
+
+    Interactive commands are always sent before background ones, and no
+    more than ``rate`` commands per second are released after a burst of
+    ``burst``. The queue holds at most ``maxsize`` commands: when full, the
+    oldest command of the lowest priority is dropped, and commands queued
+    for longer than ``max_age`` seconds are dropped instead of being sent.
+    Dropped commands fail with ZoneTouch3CommandDroppedException.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_QUEUE,
+        max_age: float = DEFAULT_MAX_AGE,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+    ) -> None:
+        """Init the scheduler."""
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.dropped = 0
+        self._bucket = ZoneTouchTokenBucket(rate, burst)
+        self._lanes: dict[CommandPriority, deque[ZoneTouchRequest]] = {
+            priority: deque()
+            for priority in sorted(CommandPriority, key=lambda p: p.value)
+        }
+        self._waiter: asyncio.Future[None] | None = None
+
+    def qsize(self) -> int:
+        """Return the number of queued commands."""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def clear(self, reason: str) -> None:
+        """Fail every queued command, e.g. when the client is stopped."""
+        for lane in self._lanes.values():
+            while lane:
+                request = lane.popleft()
+                if not request.future.done():
+                    request.future.set_exception(
+                        ZoneTouch3CommandDroppedException(reason)
+                    )
+
+    def put_nowait(self, request: ZoneTouchRequest) -> None:
+        """Add a command to its lane."""
+        request.queued_at = asyncio.get_running_loop().time()
+        if self.qsize() >= self.maxsize and not self._drop_stalest(request):
+            self._drop(request, "queue full")
+            return
+        self._lanes[request.priority].append(request)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self) -> ZoneTouchRequest:
+        """Wait for the next command that may be sent."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if (lane := self._next_lane(now)) is None:
+                self._waiter = loop.create_future()
+                try:
+                    await self._waiter
+                finally:
+                    self._waiter = None
+                continue
+            if (delay := self._bucket.delay(now)) > 0:
+                # Check the lanes again, a more urgent command may arrive
+                await asyncio.sleep(delay)
+                continue
+            self._bucket.take(now)
+            return lane.popleft()
+
+    def _next_lane(self, now: float) -> deque[ZoneTouchRequest] | None:
+        """Return the lane of the next command, skipping dead commands."""
+        for lane in self._lanes.values():
+            while lane:
+                request = lane[0]
+                if request.future.done():
+                    lane.popleft()
+                elif now - request.queued_at > self.max_age:
+                    lane.popleft()
+                    self._drop(request, "stale")
+                else:
+                    return lane
+        return None
+
+    def _drop_stalest(self, request: ZoneTouchRequest) -> bool:
+        """Make room for a request by dropping the oldest less urgent one."""
+        for priority in reversed(self._lanes):
+            if priority.value < request.priority.value:
+                break
+            if lane := self._lanes[priority]:
+                self._drop(lane.popleft(), "queue full")
+                return True
+        return False
+
+    def _drop(self, request: ZoneTouchRequest, reason: str) -> None:
+        """Fail a command that will not be sent."""
+        self.dropped += 1
+        _LOGGER.debug("Dropping msg_id (%d): %s", request.msg_id, reason)
+        if not request.future.done():
+            request.future.set_exception(ZoneTouch3CommandDroppedException(reason))
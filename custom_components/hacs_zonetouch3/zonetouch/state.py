@@ -2,15 +2,88 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 import struct
+from typing import Any
 
+from .codec import CRC_SIZE, HEADER, HEADER_SIZE, UINT16
 from .enums import Command, ExData, Response, ServiceDueStatus
-from .group import GroupPowerStatus, ZoneTouch3Group
+from .group import (
+    GROUP_RECORD,
+    GROUP_SIGN_SPILL,
+    GROUP_SIGN_TURBO,
+    GroupPowerStatus,
+    ZoneTouch3Group,
+    decode_group_records,
+    iter_group_records,
+)
 from .message import ZoneTouchMessage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Data type, device id, owner, opt, service due, password, installer,
+# telephone and temperature, followed by length prefixed version strings
+SYSTEM_INFO = struct.Struct(">H8s16sBB8s10s12sh")
+# Group count, group record length, name length, 1 unused byte
+GROUP_INFO = struct.Struct(">bbbx")
+# Offset of the name within a group record
+GROUP_INFO_NAME_OFFSET = 10
+
+# State attributes kept by as_dict, the controller password is left out
+STATE_TEXT_ATTRIBUTES = ("device_id", "owner", "hardware_version", "firmware_version")
+STATE_BYTES_ATTRIBUTES = (
+    "installer",
+    "telephone",
+    "boot_version",
+    "console_version",
+    "console_id",
+)
+
+
+@dataclass
+class ZoneTouch3StateChanges:
+    """Changes applied to the state by a single message."""
+
+    groups: dict[int, set[str]] = field(default_factory=dict)
+    temperature: bool = False
+    full: bool = False
+
+    def __bool__(self) -> bool:
+        """Return true if anything changed."""
+        return self.full or self.temperature or bool(self.groups)
+
+    def add_group_change(self, group_id: int, attribute: str) -> None:
+        """Record a changed group attribute."""
+        self.groups.setdefault(group_id, set()).add(attribute)
+
+    def merge(self, other: ZoneTouch3StateChanges) -> None:
+        """Add the changes of a later message."""
+        for group_id, attributes in other.groups.items():
+            self.groups.setdefault(group_id, set()).update(attributes)
+        self.temperature |= other.temperature
+        self.full |= other.full
+
+    def affects(self, group_id: int | None, attributes: frozenset[str]) -> bool:
+        """Return true if the changes touch the attributes of a group.
+
+        A group_id of None matches the attributes of any group, and the
+        ``temperature`` attribute matches a changed temperature. A full
+        change, e.g. after a resync, affects everything.
+        """
+        if self.full:
+            return True
+        if self.temperature and "temperature" in attributes:
+            return True
+        if group_id is None:
+            return any(
+                not attributes.isdisjoint(changed) for changed in self.groups.values()
+            )
+        changed = self.groups.get(group_id)
+        return changed is not None and not attributes.isdisjoint(changed)
+
 
 class ZoneTouch3State:
     """A class to hold FullState."""
@@ -36,139 +109,158 @@ class ZoneTouch3State:
     def from_bytes(raw_response: bytes) -> ZoneTouch3State:
         """Create state from raw response."""
         zonetouch = ZoneTouch3State()
-        header, address, message_id, message_type, data_length = struct.unpack(
-            ">IHBBH", raw_response[:10]
-        )
+        _, _, _, _, message_type, data_length = HEADER.unpack_from(raw_response)
+        if len(raw_response) != HEADER_SIZE + data_length + CRC_SIZE:
+            raise ValueError("Frame length does not match its header")
         data_raw = raw_response[-data_length - 2 : -2]
 
         if Command(message_type) == Command.COMMAND_EXPAND:
-            data_type = struct.unpack_from(">H", data_raw, 0)[0]
+            if data_length < UINT16.size:
+                raise ValueError("Expand data type past the end of the frame")
+            data_type = UINT16.unpack_from(data_raw, 0)[0]
             if ExData(data_type) == ExData.EX_DATA_FULL_STATE:
-                len = zonetouch.__parseSystemInfo(data_raw)
-                zonetouch.__parseGroupInfo(data_raw[len:])
+                offset = zonetouch.__parseSystemInfo(data_raw)
+                zonetouch.__parseGroupInfo(data_raw[offset:])
 
         return zonetouch
 
-    def updateFromMessage(self, msg: ZoneTouchMessage) -> None:
-        """Update state from new message."""
-        match msg.sub_message_type:
-            case Response.RESPONSE_SENSOR:
-                self.temperature = msg.temperature
-            case Response.RESPONSE_GROUP_CONTROL:
-                for groupIndex in msg.groups:
-                    self.groups[groupIndex].position = msg.groups[groupIndex].position
-                    self.groups[groupIndex].status = msg.groups[groupIndex].status
-                    self.groups[groupIndex].is_spill_on = msg.groups[
-                        groupIndex
-                    ].is_spill_on
-            case Response.RESPONSE_GROUP_NAME:
-                for groupIndex, group_data in msg.groups.items():
-                    if groupIndex in self.groups:
-                        self.groups[groupIndex].name = group_data.name
-            case _:
-                _LOGGER.debug("Unhandled sub message type")
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as a JSON serializable dict."""
+        data: dict[str, Any] = {
+            "opt": self.opt,
+            "service_due": self.service_due.value,
+            "temperature": self.temperature,
+        }
+        for name in STATE_TEXT_ATTRIBUTES:
+            data[name] = getattr(self, name, "")
+        for name in STATE_BYTES_ATTRIBUTES:
+            data[name] = getattr(self, name, b"").hex()
+        data["groups"] = [
+            {
+                "id": group.id,
+                "name": group.name,
+                "position": group.position,
+                "status": group.status.value,
+                "is_support_turbo": group.is_support_turbo,
+                "is_spill_on": group.is_spill_on,
+                "is_spill_set": group.is_spill_set,
+            }
+            for group in self.groups.values()
+        ]
+        return data
 
-    def __parseSystemInfo(self, data_raw):
-        """Parse raw data."""
-        self.device_id = (
-            struct.unpack_from(">8s", data_raw, 2)[0]
-            .decode("utf-8")
-            .rstrip("\x00")
-            .strip()
-        )
-        self.owner = (
-            struct.unpack_from(">16s", data_raw, 10)[0]
-            .decode("utf-8")
-            .rstrip("\x00")
-            .strip()
-        )
-        self.opt = struct.unpack_from(">B", data_raw, 26)[0]
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> ZoneTouch3State:
+        """Create state from a dict made by as_dict."""
+        zonetouch = ZoneTouch3State()
+        zonetouch.opt = data["opt"]
+        zonetouch.service_due = ServiceDueStatus(data["service_due"])
+        zonetouch.temperature = data["temperature"]
+        for name in STATE_TEXT_ATTRIBUTES:
+            setattr(zonetouch, name, data[name])
+        for name in STATE_BYTES_ATTRIBUTES:
+            setattr(zonetouch, name, bytes.fromhex(data[name]))
+        for group_data in data["groups"]:
+            group = ZoneTouch3Group(
+                group_data["id"],
+                group_data["name"],
+                group_data["position"],
+                GroupPowerStatus(group_data["status"]),
+                group_data["is_support_turbo"],
+                group_data["is_spill_on"],
+                group_data["is_spill_set"],
+            )
+            zonetouch.groups[group.id] = group
+        return zonetouch
 
-        # Service Due
-        _service_due = struct.unpack_from(">B", data_raw, 27)[0]
-        self.service_due = ServiceDueStatus(_service_due)
+    def updateFromMessage(self, msg: ZoneTouchMessage) -> ZoneTouch3StateChanges:
+        """Update state from new message and return what changed."""
+        changes = ZoneTouch3StateChanges()
+        apply = MESSAGE_APPLY.get(msg.sub_message_type)
+        if apply is None:
+            _LOGGER.debug("Unhandled sub message type %s", msg.sub_message_type)
+        else:
+            apply(self, msg, changes)
+        return changes
 
-        self.password = struct.unpack_from(">8s", data_raw, 28)[0]
-        self.installer = struct.unpack_from(">10s", data_raw, 36)[0]
-        self.telephone = struct.unpack_from(">12s", data_raw, 46)[0]
-        self.temperature = struct.unpack_from(">h", data_raw, 58)[0]
-        self.temperature = (self.temperature - 500) / 10
-
-        offset = 60
-        _hardware_version_len = struct.unpack_from(">b", data_raw, offset)[0]
-        self.hardware_version = (
-            struct.unpack_from(f">{_hardware_version_len}s", data_raw, offset + 1)[0]
-            .decode("utf-8")
-            .rstrip("\x00")
-            .strip()
-        )
+    def updateFromState(self, state: ZoneTouch3State) -> None:
+        """Update state from a freshly received full state.
 
-        offset += _hardware_version_len + 1
-        _firmware_version_length = struct.unpack_from(">b", data_raw, offset)[0]
-        self.firmware_version = (
-            struct.unpack_from(f">{_firmware_version_length}s", data_raw, offset + 1)[0]
-            .decode("utf-8")
-            .rstrip("\x00")
-            .strip()
-        )
+        Existing groups are updated in place so references to them stay valid.
+        """
+        for name, value in vars(state).items():
+            if name != "groups":
+                setattr(self, name, value)
+        for groupIndex, group_data in state.groups.items():
+            group = self.groups.get(groupIndex)
+            if group is None:
+                self.groups[groupIndex] = group_data
+                continue
+            group.name = group_data.name
+            group.position = group_data.position
+            group.status = group_data.status
+            group.is_support_turbo = group_data.is_support_turbo
+            group.is_spill_on = group_data.is_spill_on
+            group.is_spill_set = group_data.is_spill_set
 
-        offset += _firmware_version_length + 1
-        _boot_version_length = struct.unpack_from(">b", data_raw, offset)[0]
-        self.boot_version = struct.unpack_from(
-            f">{_boot_version_length}s", data_raw, offset + 1
-        )[0]
-
-        offset += _boot_version_length + 1
-        _console_version_length = struct.unpack_from(">b", data_raw, offset)[0]
-        self.console_version = struct.unpack_from(
-            f">{_console_version_length}s", data_raw, offset + 1
-        )[0]
-
-        offset += _console_version_length + 1
-        _console_id_length = struct.unpack_from(">b", data_raw, offset)[0]
-        self.console_id = struct.unpack_from(
-            f">{_console_id_length}s", data_raw, offset + 1
-        )[0]
-
-        return offset + _console_id_length + 1
-
-    def __parseOneGroupInfo(self, data) -> ZoneTouch3Group:
-        index: int = struct.unpack_from(">B", data, 0)[0]
-        position = struct.unpack_from(">B", data, 1)[0]
-        sign = struct.unpack_from(">B", data, 6)[0]
-
-        groupIndex = index & 0x3F
-        powerStatus = GroupPowerStatus(index >> 6)
-        is_support_turbo = (sign & 0x80) != 0
-        is_spill_on = (sign & 0x02) != 0
-
-        return ZoneTouch3Group(
-            groupIndex,
-            "name",
-            position,
-            powerStatus,
-            is_support_turbo,
-            is_spill_on,
-            False,
-        )
+    def __parseSystemInfo(self, data_raw):
+        """Parse raw data."""
+        if len(data_raw) < SYSTEM_INFO.size:
+            raise ValueError("System info past the end of the data")
+        (
+            _,
+            device_id,
+            owner,
+            self.opt,
+            _service_due,
+            self.password,
+            self.installer,
+            self.telephone,
+            temperature,
+        ) = SYSTEM_INFO.unpack_from(data_raw)
+        self.device_id = device_id.decode("utf-8").rstrip("\x00").strip()
+        self.owner = owner.decode("utf-8").rstrip("\x00").strip()
+        self.service_due = ServiceDueStatus(_service_due)
+        self.temperature = (temperature - 500) / 10
+
+        offset = SYSTEM_INFO.size
+        hardware_version, offset = _unpack_string(data_raw, offset)
+        self.hardware_version = hardware_version.decode("utf-8").rstrip("\x00").strip()
+        firmware_version, offset = _unpack_string(data_raw, offset)
+        self.firmware_version = firmware_version.decode("utf-8").rstrip("\x00").strip()
+        self.boot_version, offset = _unpack_string(data_raw, offset)
+        self.console_version, offset = _unpack_string(data_raw, offset)
+        self.console_id, offset = _unpack_string(data_raw, offset)
+        return offset
 
     def __parseGroupInfo(self, data):
         """Parse group info."""
-        group_count = struct.unpack_from(">b", data, 0)[0]
-        data_len = struct.unpack_from(">b", data, 1)[0]
-        name_len = struct.unpack_from(">b", data, 2)[0]
+        if len(data) < GROUP_INFO.size:
+            raise ValueError("Group info past the end of the data")
+        group_count, data_len, name_len = GROUP_INFO.unpack_from(data, 0)
+        if group_count <= 0:
+            return
+        if name_len < 0 or GROUP_INFO_NAME_OFFSET + name_len > data_len:
+            raise ValueError("Group records past the end of the data")
 
-        for idx, x in enumerate(range(group_count)):
-            group = self.__parseOneGroupInfo(
-                data[data_len * idx + 4 : (data_len * idx) + 12]
-            )
-            group.name = (
-                struct.unpack_from(f">{name_len}s", data, (data_len * idx) + 14)[0]
-                .decode("utf-8")
-                .rstrip("\x00")
-                .strip()
+        indexes, positions, signs = decode_group_records(
+            data, group_count, data_len, GROUP_INFO.size
+        )
+        names = _group_name_struct(data_len, name_len).iter_unpack(
+            memoryview(data)[GROUP_INFO.size : GROUP_INFO.size + data_len * group_count]
+        )
+        for index, position, sign, (name,) in zip(
+            indexes, positions, signs, names, strict=True
+        ):
+            group = ZoneTouch3Group(
+                index & 0x3F,
+                name.decode("utf-8").rstrip("\x00").strip(),
+                position,
+                GroupPowerStatus(index >> 6),
+                (sign & GROUP_SIGN_TURBO) != 0,
+                (sign & GROUP_SIGN_SPILL) != 0,
+                False,
             )
-
             self.groups[group.id] = group
 
     def __str__(self):
@@ -179,3 +271,90 @@ class ZoneTouch3State:
         Temperature:\t{self.temperature}
         Groups:\t{self.groups}
         """
+
+
+@lru_cache(maxsize=8)
+def _group_name_struct(stride: int, name_len: int) -> struct.Struct:
+    """Return a struct reading the name of a group record of stride bytes."""
+    return struct.Struct(
+        f"{GROUP_INFO_NAME_OFFSET}x{name_len}s"
+        f"{stride - GROUP_INFO_NAME_OFFSET - name_len}x"
+    )
+
+
+def _unpack_string(data: bytes, offset: int) -> tuple[bytes, int]:
+    """Return a length prefixed string and the offset following it."""
+    if offset >= len(data) or offset + 1 + data[offset] > len(data):
+        raise ValueError("String past the end of the data")
+    end = offset + 1 + data[offset]
+    return bytes(data[offset + 1 : end]), end
+
+
+def _apply_sensor(
+    state: ZoneTouch3State, msg: ZoneTouchMessage, changes: ZoneTouch3StateChanges
+) -> None:
+    """Apply the temperature of a sensor message."""
+    if state.temperature != msg.temperature:
+        state.temperature = msg.temperature
+        changes.temperature = True
+
+
+def _apply_group_control(
+    state: ZoneTouch3State, msg: ZoneTouchMessage, changes: ZoneTouch3StateChanges
+) -> None:
+    """Write group control records straight into the existing groups."""
+    for index, position, sign in iter_group_records(
+        msg.message_data, msg.count, GROUP_RECORD.size
+    ):
+        group = state.groups.get(index & 0x3F)
+        if group is None:
+            continue
+
+        status = GroupPowerStatus(index >> 6)
+        is_spill_on = (sign & GROUP_SIGN_SPILL) != 0
+        if group.position != position:
+            group.position = position
+            changes.add_group_change(group.id, "position")
+        if group.status is not status:
+            group.status = status
+            changes.add_group_change(group.id, "status")
+        if group.is_spill_on != is_spill_on:
+            group.is_spill_on = is_spill_on
+            changes.add_group_change(group.id, "is_spill_on")
+
+
+def _apply_group_names(
+    state: ZoneTouch3State, msg: ZoneTouchMessage, changes: ZoneTouch3StateChanges
+) -> None:
+    """Apply the names of a group name message."""
+    for groupIndex, name in msg.group_names.items():
+        group = state.groups.get(groupIndex)
+        if group is not None and group.name != name:
+            group.name = name
+            changes.add_group_change(groupIndex, "name")
+
+
+def _apply_spill(
+    state: ZoneTouch3State, msg: ZoneTouchMessage, changes: ZoneTouch3StateChanges
+) -> None:
+    """Apply the spill setting of a spill message."""
+    if msg.count < 1:
+        return
+    spill_groups = msg.spill_groups
+    for group in state.groups.values():
+        is_spill_set = group.id in spill_groups
+        if group.is_spill_set != is_spill_set:
+            group.is_spill_set = is_spill_set
+            changes.add_group_change(group.id, "is_spill_set")
+
+
+# State update of each sub message type
+MESSAGE_APPLY: dict[
+    Response,
+    Callable[[ZoneTouch3State, ZoneTouchMessage, ZoneTouch3StateChanges], None],
+] = {
+    Response.RESPONSE_SENSOR: _apply_sensor,
+    Response.RESPONSE_GROUP_CONTROL: _apply_group_control,
+    Response.RESPONSE_GROUP_NAME: _apply_group_names,
+    Response.RESPONSE_SPILL: _apply_spill,
+}
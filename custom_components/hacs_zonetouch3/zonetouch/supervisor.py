@@ -0,0 +1,131 @@
+"""ZoneTouch 3 connection supervisor."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+import logging
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .zonetouch import ZoneTouch
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BACKOFF_MIN = 1.0
+DEFAULT_BACKOFF_MAX = 60.0
+
+
+class ZoneTouchSupervisor:
+    """Own the reader and writer tasks of a ZoneTouch connection.
+
+    Exactly one listener and one send queue task run at a time. When either
+    of them stops, both are cancelled, commands waiting for a reply fail, and
+    the connection is re-established with exponential backoff and jitter.
+    The state is resynced while the tasks run, as the listener reads the
+    replies.
+    """
+
+    def __init__(
+        self,
+        client: ZoneTouch,
+        backoff_min: float = DEFAULT_BACKOFF_MIN,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ) -> None:
+        """Init the supervisor."""
+        self._client = client
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return true if the supervisor is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start supervising the connection."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="zonetouch supervisor")
+
+    async def stop(self) -> None:
+        """Stop the supervisor and the tasks it owns."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before a reconnect attempt."""
+        delay = min(self._backoff_max, self._backoff_min * 2**attempt)
+        return delay * random.uniform(0.5, 1)
+
+    async def _run(self) -> None:
+        """Keep the connection up until cancelled."""
+        client = self._client
+        attempt = 0
+        # The first connection is not a reconnect
+        lost = False
+        while True:
+            resync = False
+            if not client.connected:
+                if attempt:
+                    delay = self.backoff(attempt - 1)
+                    _LOGGER.debug("Reconnecting in %.1f seconds", delay)
+                    await asyncio.sleep(delay)
+                try:
+                    await client.connect()
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug("Reconnect failed (%s)", err)
+                    await client.close()
+                    attempt += 1
+                    continue
+                if lost:
+                    client.metrics.reconnects += 1
+                resync = True
+
+            error, synced = await self._run_tasks(resync)
+            # Only a synced connection resets the backoff
+            attempt = 0 if synced else attempt + 1
+            _LOGGER.debug("Connection lost (%s)", error)
+            await client.connection_lost(error)
+            lost = True
+
+    async def _run_tasks(self, resync: bool) -> tuple[BaseException | None, bool]:
+        """Run the listener and send queue until one of them stops.
+
+        Returns the error that stopped them and whether the state was synced.
+        A failed resync drops the connection.
+        """
+        client = self._client
+        tasks = {
+            asyncio.create_task(client.listen(), name="zonetouch listener"),
+            asyncio.create_task(client.send_queue(), name="zonetouch sender"),
+        }
+        waiting = set(tasks)
+        if resync:
+            resync_task = asyncio.create_task(
+                client.async_resync(), name="zonetouch resync"
+            )
+            tasks.add(resync_task)
+            waiting.add(resync_task)
+        synced = not resync
+        try:
+            while True:
+                done, waiting = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if not task.cancelled() and (error := task.exception()):
+                        return error, synced
+                if resync and resync_task in done:
+                    synced = True
+                    done.discard(resync_task)
+                if done:
+                    return None, synced
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
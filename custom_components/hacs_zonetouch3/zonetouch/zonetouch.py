@@ -2,33 +2,38 @@
 
 import asyncio
 from collections.abc import Callable
+from functools import partial
 import logging
 import socket
-import struct
 from typing import Any
 
+from .capture import ZoneTouchCapture
+from .codec import replace_msg_id
+from .enums import CaptureDirection, CommandPriority, GroupControl
+from .exceptions import (  # noqa: F401
+    ZoneTouch3ClientError,
+    ZoneTouch3CommandDroppedException,
+    ZoneTouch3ConnectionFailedException,
+    ZoneTouch3Exception,
+    ZoneTouch3MessageIdsExhaustedException,
+)
+from .framer import ZoneTouchFramer
 from .message import ZoneTouchMessage
 from .messages.fullstate import FullState
+from .messages.group import GroupCommand
 from .messages.spill import Spill
-from .state import ZoneTouch3State
+from .metrics import ZoneTouchMetrics
+from .msgid import ZoneTouchMessageIdAllocator
+from .request import ZoneTouchRequest
+from .scheduler import ZoneTouchScheduler
+from .state import ZoneTouch3State, ZoneTouch3StateChanges
+from .supervisor import ZoneTouchSupervisor
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class ZoneTouch3Exception(Exception):
-    """Base class for errors throw by ZoneTouch3."""
-
-    def __init__(self, reason: str | None = None) -> None:
-        """Init the exception."""
-        self.reason = reason
-
-
-class ZoneTouch3ClientError(ZoneTouch3Exception):
-    """Exception to indicate a general API error."""
-
-
-class ZoneTouch3ConnectionFailedException(ZoneTouch3Exception):
-    """Exception to indicate a general API error."""
+DEFAULT_SEND_WINDOW = 8
+DEFAULT_COMMAND_TIMEOUT = 10
+GROUP_COMMAND_COALESCE_DELAY = 0.05
 
 
 class ZoneTouch:
@@ -40,38 +45,84 @@ class ZoneTouch:
         port: int,
         on_state_update: Callable,
         on_disconnect: Callable,
+        send_window: int = DEFAULT_SEND_WINDOW,
+        command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+        capture: ZoneTouchCapture | None = None,
     ) -> None:
-        """Sample API Client."""
+        """Sample API Client.
+
+        Pass a ZoneTouchCapture to record every frame sent and received.
+        """
         self._host = host
         self._port = port
+        self._send_window = asyncio.Semaphore(send_window)
+        self._command_timeout = command_timeout
+        self.capture = capture
         self.sock: socket.socket
         self.reader: asyncio.StreamReader
         self.writer: asyncio.StreamWriter
-        self.queue: asyncio.Queue = asyncio.Queue()
-        self.pending_commands: dict[int, asyncio.Future[Any]] = {}
+        self.framer = ZoneTouchFramer()
+        self.queue = ZoneTouchScheduler()
+        self.pending_commands: dict[int, ZoneTouchRequest] = {}
+        self._group_commands: dict[int, tuple[GroupControl, int]] = {}
+        self._group_commands_flush: asyncio.TimerHandle | None = None
+        self._group_commands_future: asyncio.Future[Any] | None = None
         self.connected = False
         self.on_state_update = on_state_update
         self.on_disconnect = on_disconnect
-        self.listener: asyncio.Task
+        self.supervisor = ZoneTouchSupervisor(self)
+        self.metrics = ZoneTouchMetrics(self.queue.qsize, lambda: self.queue.dropped)
         self.state = ZoneTouch3State()
-
-    async def async_get_full_state(self) -> ZoneTouch3State | None:
-        """Get data from the API."""
-        full_state_command = FullState().build_packet()
-        data = await self.send(full_state_command, True)
-        if data:
-            self.state = ZoneTouch3State.from_bytes(data)
-
-            spill_state_command = Spill().build_packet()
-            spill_response = await self.send(spill_state_command, True)
-            spill_message = Spill.from_bytes(spill_response)
-            if spill_message:
-                for group in self.state.groups.values():
-                    group.is_spill_set = group.id in spill_message.groups
-
-            return self.state
-
-        return None
+        self.msg_ids = ZoneTouchMessageIdAllocator()
+
+    def next_msg_id(self) -> int:
+        """Return the next message ID of this connection.
+
+        The ID is reserved when the command is sent. A command whose ID was
+        taken by another one in the meantime is sent with a free ID.
+        """
+        return self.msg_ids.next()
+
+    async def async_get_full_state(self) -> ZoneTouch3State:
+        """Get data from the API.
+
+        The full state and spill requests are sent together and their replies
+        are read by the listener, so it has to be running. The received state
+        is merged into the existing state, so groups handed out earlier stay
+        up to date.
+        """
+        state, spill = await asyncio.gather(
+            self.request(FullState().build_packet(self.next_msg_id())),
+            self.request(Spill().build_packet(self.next_msg_id())),
+        )
+        if spill:
+            for group in state.groups.values():
+                group.is_spill_set = group.id in spill.groups
+
+        self.state.updateFromState(state)
+        return self.state
+
+    async def request(
+        self,
+        data: bytes,
+        timeout: float | None = None,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+    ) -> Any:
+        """Send a command and return its decoded reply.
+
+        Full state requests return a ZoneTouch3State, spill requests a Spill
+        and other commands the ZoneTouchMessage of the reply. Raises
+        TimeoutError when no reply arrives within ``timeout`` seconds of the
+        command being queued, also while the client is offline, and
+        ZoneTouch3CommandDroppedException when the scheduler drops the command
+        or the client is stopped. Cancelling the call cancels the command.
+        """
+        return await self.queue_command(data, timeout, priority)
+
+    async def async_resync(self) -> None:
+        """Resync the state after a reconnect."""
+        if await self.async_get_full_state() and self.on_state_update:
+            self.on_state_update(self.state, ZoneTouch3StateChanges(full=True))
 
     async def connect(self):
         """Connect to the ZoneTouch3 controller."""
@@ -97,6 +148,7 @@ class ZoneTouch:
 
             conn = asyncio.open_connection(sock=self.sock)
             self.reader, self.writer = await asyncio.wait_for(conn, timeout=5)
+            self.framer.reset()
             self.connected = True
             _LOGGER.debug("Connected to %s:%s", self._host, self._port)
         except Exception as exception:
@@ -108,105 +160,221 @@ class ZoneTouch:
     async def close(self) -> None:
         """Close the connection."""
         _LOGGER.debug("Connection closing")
-        self.sock.close()
-        if self.writer:
-            self.writer.close()
-        _LOGGER.debug("Connection closed")
         self.connected = False
+        if sock := getattr(self, "sock", None):
+            sock.close()
+        if writer := getattr(self, "writer", None):
+            writer.close()
+        _LOGGER.debug("Connection closed")
 
-    def start_listener(self):
-        """Start the listener."""
-        _LOGGER.debug("Starting listener")
-        self.listener = asyncio.create_task(self.listen())
-        _LOGGER.debug("Listener started")
-
-    def stop_listener(self):
-        """Stop the listener."""
-        _LOGGER.debug("Stopping listener")
-        self.listener.cancel()
-        _LOGGER.debug("Listener stopped")
+    def start(self) -> None:
+        """Start the listener and send queue, reconnecting when needed."""
+        _LOGGER.debug("Starting supervisor")
+        self.supervisor.start()
+
+    async def stop(self) -> None:
+        """Stop all tasks and close the connection."""
+        _LOGGER.debug("Stopping supervisor")
+        await self.supervisor.stop()
+        if self._group_commands_flush is not None:
+            self._group_commands_flush.cancel()
+            self._group_commands_flush = None
+        self._group_commands = {}
+        future, self._group_commands_future = self._group_commands_future, None
+        if future is not None and not future.done():
+            future.set_exception(ZoneTouch3CommandDroppedException("Client stopped"))
+        self.queue.clear("Client stopped")
+        self.__fail_pending_commands("Client stopped")
+        await self.close()
+        if self.capture is not None:
+            # Waits for the writer thread, off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.capture.close)
+
+    async def connection_lost(self, error: BaseException | None) -> None:
+        """Clean up after the connection was lost."""
+        self.__fail_pending_commands(f"Connection lost: {error}")
+        await self.close()
+        if self.on_disconnect:
+            self.on_disconnect()
+
+    def __fail_pending_commands(self, reason: str) -> None:
+        """Fail every command still waiting for a reply."""
+        for request in list(self.pending_commands.values()):
+            if not request.future.done():
+                request.future.set_exception(
+                    ZoneTouch3ConnectionFailedException(reason)
+                )
+
+    def queue_command(
+        self,
+        data: bytes,
+        timeout: float | None = None,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+    ) -> asyncio.Future[Any]:
+        """Add a command to the queue.
+
+        Returns a future resolved with the decoded reply, see request.
+        """
+        future = self.__create_future(timeout)
+        self.__queue_request(data, future, priority)
+        return future
+
+    def __create_future(self, timeout: float | None = None) -> asyncio.Future[Any]:
+        """Create the future of a command, failing it after its timeout."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        deadline = loop.call_later(
+            timeout or self._command_timeout, self.__expire_command, future
+        )
+        future.add_done_callback(lambda _: deadline.cancel())
+        return future
+
+    def __queue_request(
+        self,
+        data: bytes,
+        future: asyncio.Future[Any],
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+    ) -> None:
+        """Add a command to the queue, resolving future with its reply."""
+        self.queue.put_nowait(ZoneTouchRequest(data, future, priority))
+        self.metrics.command_queued()
+
+    def queue_group_command(
+        self, group_id: int, control: GroupControl, position: int = 0
+    ) -> asyncio.Future[ZoneTouchMessage]:
+        """Add a group control to the queue.
+
+        Group controls are held for a short moment before being queued. A
+        newer control for the same group replaces the pending one, and the
+        controls of different groups are sent as one multi group packet.
+
+        Returns a future resolved with the RESPONSE_GROUP_CONTROL echo of the
+        packet, which is shared by all controls sent with it.
+        """
+        self._group_commands[group_id] = (control, position)
+        future = self._group_commands_future
+        if future is None:
+            future = self._group_commands_future = self.__create_future()
+            self._group_commands_flush = asyncio.get_running_loop().call_later(
+                GROUP_COMMAND_COALESCE_DELAY, self.__flush_group_commands
+            )
+        return future
+
+    def __flush_group_commands(self) -> None:
+        """Queue all pending group controls as a single packet."""
+        self._group_commands_flush = None
+        future, self._group_commands_future = self._group_commands_future, None
+        group_commands, self._group_commands = self._group_commands, {}
+        if group_commands and future is not None:
+            self.__queue_request(
+                GroupCommand().build_packet(
+                    (
+                        (group_id, control, position)
+                        for group_id, (control, position) in group_commands.items()
+                    ),
+                    self.next_msg_id(),
+                ),
+                future,
+            )
 
-    async def queue_command(self, data: bytes):
-        """Add commands to queue."""
-        await self.queue.put(data)
+    async def send(self, data: bytes) -> None:
+        """Send a command.
 
-    async def send(self, data: bytes, wait=False) -> bytes | None:
-        """Send a command."""
+        Replies are only read by the listener, use request to wait for one.
+        """
         if not self.writer:
             _LOGGER.error("Not connected. Call connect() first")
 
         _LOGGER.debug("-> %s", data.hex())
+        if self.capture is not None:
+            self.capture.write(CaptureDirection.SENT, data)
         self.writer.write(data)
         await self.writer.drain()
-        if wait:
-            data = await self.reader.read(1024)
-            if not data:
-                raise ConnectionResetError("No response received.")
-            return data
 
-        return None
+    async def send_queue(self) -> None:
+        """Send queue processor.
 
-    async def send_queue(self) -> bytes | None:
-        """Send queue processor."""
+        Up to ``send_window`` commands are written without waiting for the
+        echo of the previous one. Every command has its own deadline, set when
+        it was queued, so a lost reply only holds its own slot in the window.
+        The message ID of a command is reserved while it is in flight, so
+        replies are never matched to the wrong command.
+        """
+        loop = asyncio.get_running_loop()
         while True:
-            data = await self.queue.get()
-            msg_id: int = struct.unpack_from(">B", data, 6)[0]
-            future = asyncio.get_event_loop().create_future()
-            self.pending_commands[msg_id] = future
-            _LOGGER.debug("-> %s", data.hex())
-            self.writer.write(data)
-            await self.writer.drain()
-
+            await self._send_window.acquire()
             try:
-                await asyncio.wait_for(future, timeout=10)
-                _LOGGER.debug("Received response for msg_id (%d)", msg_id)
-            except TimeoutError:
-                _LOGGER.debug("Timeout waiting for response to msg_id (%d)", msg_id)
-            finally:
-                self.pending_commands.pop(msg_id, None)
-
-            self.queue.task_done()
-
-    def start_send_queue(self):
-        """Start processing the send queue."""
-        _LOGGER.debug("Starting send queue")
-        self.listener = asyncio.create_task(self.send_queue())
-        _LOGGER.debug("Send queue started")
-
-    async def listen(self):
-        """Listen for incoming data from Zone Touch 3 controller."""
-        if not self.reader:
-            _LOGGER.debug("Not connected. Call connect() first")
-            return
+                request = await self.queue.get()
+            except asyncio.CancelledError:
+                self._send_window.release()
+                raise
+            try:
+                msg_id = self.msg_ids.acquire(request.msg_id)
+            except ZoneTouch3MessageIdsExhaustedException as err:
+                request.future.set_exception(err)
+                self._send_window.release()
+                continue
+            if msg_id != request.msg_id:
+                request.data = replace_msg_id(request.data, msg_id)
+            self.pending_commands[msg_id] = request
+            request.future.add_done_callback(
+                partial(self.__command_done, request, loop.time())
+            )
+            await self.send(request.data)
 
-        try:
-            while True:
-                data = await self.reader.read(1024)
-                if not data:
-                    raise ConnectionResetError("Connection closed by server.")  # noqa: TRY301
-                ztm = ZoneTouchMessage(data)
-                self.state.updateFromMessage(ztm)
-                if self.on_state_update:
-                    self.on_state_update(self.state)
-                future = self.pending_commands.get(ztm.message_id)
-                if future and not future.done():
-                    future.set_result(True)
-        except asyncio.CancelledError:
-            _LOGGER.debug("Listener task cancelled")
-        except (
-            ConnectionAbortedError,
-            ConnectionResetError,
-            BrokenPipeError,
-        ) as ex:
-            _LOGGER.debug("Connection lost (%s) - Reconnecting in 5 seconds", ex)
-            await asyncio.sleep(5)
-            await self.connect()
-            self.start_listener()
-            self.start_send_queue()
-        except Exception as ex:
-            _LOGGER.error(ex, stack_info=True, exc_info=True)
-            _LOGGER.debug("Connection lost (%s) - Reconnecting in 5 seconds", ex)
-            await asyncio.sleep(5)
-            await self.connect()
-            self.start_listener()
-            self.start_send_queue()
+    def __expire_command(self, future: asyncio.Future[Any]) -> None:
+        """Fail a command that was not answered before its deadline."""
+        if not future.done():
+            self.metrics.timeouts += 1
+            future.set_exception(TimeoutError())
+
+    def __command_done(
+        self,
+        request: ZoneTouchRequest,
+        sent_at: float,
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Release the window slot of a completed command."""
+        msg_id = request.msg_id
+        if self.pending_commands.get(msg_id) is request:
+            del self.pending_commands[msg_id]
+        self.msg_ids.release(msg_id)
+        if future.cancelled():
+            _LOGGER.debug("Command msg_id (%d) cancelled", msg_id)
+        elif (error := future.exception()) is not None:
+            _LOGGER.debug("No response to msg_id (%d): %r", msg_id, error)
+        else:
+            self.metrics.command_completed(
+                request.command, asyncio.get_running_loop().time() - sent_at
+            )
+            _LOGGER.debug("Received response for msg_id (%d)", msg_id)
+        self._send_window.release()
+
+    def handle_frame(self, frame: bytes) -> None:
+        """Process a single complete frame."""
+        if self.capture is not None:
+            self.capture.write(CaptureDirection.RECEIVED, frame)
+        ztm = ZoneTouchMessage(frame)
+        if not ztm.valid:
+            self.metrics.crc_failures += 1
+            return
+        self.metrics.frames[ztm.sub_message_type] += 1
+        changes = self.state.updateFromMessage(ztm)
+        if changes and self.on_state_update:
+            self.on_state_update(self.state, changes)
+        request = self.pending_commands.get(ztm.message_id)
+        if request is not None and request.matches(ztm):
+            request.resolve(ztm)
+
+    async def listen(self) -> None:
+        """Listen for incoming data until the connection is lost."""
+        while True:
+            data = await self.reader.read(1024)
+            if not data:
+                raise ConnectionResetError("Connection closed by server.")
+            self.framer.feed(data)
+            for frame in self.framer:
+                try:
+                    self.handle_frame(frame)
+                except Exception:
+                    _LOGGER.exception("Failed to process frame %s", frame.hex())